@@ -7,10 +7,41 @@ import sqlite3
 import json
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Union
+
+# Optional: zstd keeps raw transcript HTML ~10x smaller on disk
+try:
+    import zstandard
+    _ZSTD_COMPRESSOR = zstandard.ZstdCompressor(level=9)
+    _ZSTD_DECOMPRESSOR = zstandard.ZstdDecompressor()
+    HAS_ZSTD = True
+except ImportError:
+    HAS_ZSTD = False
 
 DATABASE_PATH = Path(__file__).parent.parent / "data" / "transcripts.db"
 
+# Every zstd frame starts with this magic number
+ZSTD_MAGIC = b'\x28\xb5\x2f\xfd'
+
+
+def compress_html(html: Optional[Union[str, bytes]]) -> Optional[bytes]:
+    """Encode raw HTML for storage (zstd when available, plain UTF-8 otherwise)."""
+    if html is None or isinstance(html, bytes):
+        return html
+    data = html.encode('utf-8')
+    return _ZSTD_COMPRESSOR.compress(data) if HAS_ZSTD else data
+
+
+def decompress_html(blob: Optional[Union[str, bytes]]) -> Optional[str]:
+    """Decode raw HTML stored by compress_html (or legacy TEXT rows)."""
+    if blob is None or isinstance(blob, str):
+        return blob
+    if blob.startswith(ZSTD_MAGIC):
+        if not HAS_ZSTD:
+            raise RuntimeError("zstandard library required to read compressed HTML. Run: pip install zstandard")
+        blob = _ZSTD_DECOMPRESSOR.decompress(blob)
+    return blob.decode('utf-8')
+
 def init_database():
     """Initialize the SQLite database with all required tables."""
     DATABASE_PATH.parent.mkdir(parents=True, exist_ok=True)
@@ -32,7 +63,7 @@ def init_database():
             total_duration_seconds INTEGER DEFAULT 0,
             topics TEXT,  -- JSON array
             entities TEXT,  -- JSON array
-            raw_html TEXT,
+            raw_html BLOB,  -- see compress_html()
             created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
             updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
         )
@@ -167,6 +198,75 @@ def get_or_create_speaker(cursor, name: str, headshot_url: str = None) -> int:
     return cursor.lastrowid
 
 
+def update_speaker_stats(cursor):
+    """Recompute every speaker's segment and transcript counts."""
+    cursor.execute("""
+        UPDATE speakers SET 
+            total_segments = (SELECT COUNT(*) FROM segments WHERE speaker_id = speakers.id),
+            total_transcripts = (SELECT COUNT(DISTINCT transcript_id) FROM segments WHERE speaker_id = speakers.id)
+    """)
+
+
+def _write_transcript(
+    cursor,
+    transcript_id: str,
+    url: str,
+    title: str,
+    primary_speaker: str,
+    event_type: str,
+    event_date: str,
+    location: str,
+    segments: List[Dict],
+    topics: List[str] = None,
+    entities: List[str] = None,
+    raw_html: Union[str, bytes] = None
+):
+    """Write a transcript and its segments with an open cursor (speaker stats not updated)."""
+    # Calculate totals
+    total_words = sum(s.get('word_count', len(s['text'].split())) for s in segments)
+    total_duration = sum(s.get('duration_seconds', 0) for s in segments)
+    
+    # Insert main transcript
+    cursor.execute("""
+        INSERT OR REPLACE INTO transcripts 
+        (id, url, title, primary_speaker, event_type, event_date, location, 
+         total_words, total_duration_seconds, topics, entities, raw_html, updated_at)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+    """, (
+        transcript_id, url, title, primary_speaker, event_type, event_date, location,
+        total_words, total_duration, 
+        json.dumps(topics) if topics else None,
+        json.dumps(entities) if entities else None,
+        compress_html(raw_html)
+    ))
+    
+    # Delete existing segments for this transcript (for updates)
+    cursor.execute("DELETE FROM segments WHERE transcript_id = ?", (transcript_id,))
+    
+    # Insert segments; each speaker is looked up (or created) once per transcript
+    speaker_ids = {}
+    rows = []
+    for idx, seg in enumerate(segments):
+        name = seg['speaker']
+        if name not in speaker_ids:
+            speaker_ids[name] = get_or_create_speaker(cursor, name, seg.get('headshot_url'))
+        
+        rows.append((
+            transcript_id, speaker_ids[name], name, idx,
+            seg.get('start_time'), seg.get('end_time'), seg.get('duration_seconds'),
+            seg['text'], len(seg['text'].split()),
+            seg.get('sentiment_vader'), seg.get('sentiment_label'),
+            json.dumps(seg.get('topics')) if seg.get('topics') else None
+        ))
+    
+    cursor.executemany("""
+        INSERT INTO segments 
+        (transcript_id, speaker_id, speaker_name, segment_index, start_time, end_time,
+         duration_seconds, text, word_count, sentiment_vader, sentiment_label, topics)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """, rows)
+
+
 def insert_transcript(
     transcript_id: str,
     url: str,
@@ -178,59 +278,39 @@ def insert_transcript(
     segments: List[Dict],
     topics: List[str] = None,
     entities: List[str] = None,
-    raw_html: str = None
+    raw_html: Union[str, bytes] = None
 ):
     """Insert a complete transcript with all segments."""
     
     with Database() as cursor:
-        # Calculate totals
-        total_words = sum(s.get('word_count', len(s['text'].split())) for s in segments)
-        total_duration = sum(s.get('duration_seconds', 0) for s in segments)
-        
-        # Insert main transcript
-        cursor.execute("""
-            INSERT OR REPLACE INTO transcripts 
-            (id, url, title, primary_speaker, event_type, event_date, location, 
-             total_words, total_duration_seconds, topics, entities, raw_html, updated_at)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
-        """, (
-            transcript_id, url, title, primary_speaker, event_type, event_date, location,
-            total_words, total_duration, 
-            json.dumps(topics) if topics else None,
-            json.dumps(entities) if entities else None,
-            raw_html
-        ))
-        
-        # Delete existing segments for this transcript (for updates)
-        cursor.execute("DELETE FROM segments WHERE transcript_id = ?", (transcript_id,))
-        
-        # Insert segments
-        for idx, seg in enumerate(segments):
-            speaker_id = get_or_create_speaker(cursor, seg['speaker'], seg.get('headshot_url'))
-            
-            cursor.execute("""
-                INSERT INTO segments 
-                (transcript_id, speaker_id, speaker_name, segment_index, start_time, end_time,
-                 duration_seconds, text, word_count, sentiment_vader, sentiment_label, topics)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                transcript_id, speaker_id, seg['speaker'], idx,
-                seg.get('start_time'), seg.get('end_time'), seg.get('duration_seconds'),
-                seg['text'], len(seg['text'].split()),
-                seg.get('sentiment_vader'), seg.get('sentiment_label'),
-                json.dumps(seg.get('topics')) if seg.get('topics') else None
-            ))
-        
-        # Update speaker stats
-        cursor.execute("""
-            UPDATE speakers SET 
-                total_segments = (SELECT COUNT(*) FROM segments WHERE speaker_id = speakers.id),
-                total_transcripts = (SELECT COUNT(DISTINCT transcript_id) FROM segments WHERE speaker_id = speakers.id)
-        """)
+        _write_transcript(
+            cursor, transcript_id, url, title, primary_speaker, event_type, event_date,
+            location, segments, topics, entities, raw_html
+        )
+        update_speaker_stats(cursor)
         
     return transcript_id
 
 
+def insert_transcripts(transcripts: List[Dict]) -> int:
+    """
+    Insert many transcripts (insert_transcript keyword arguments) in a single
+    transaction, refreshing speaker stats once at the end. All or nothing.
+    """
+    if not transcripts:
+        return 0
+    
+    with Database() as cursor:
+        # WAL + relaxed sync: one cheap fsync for the whole batch
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        for transcript in transcripts:
+            _write_transcript(cursor, **transcript)
+        update_speaker_stats(cursor)
+    
+    return len(transcripts)
+
+
 def search_segments(
     query: str,
     speaker: str = None,
@@ -325,7 +405,12 @@ def get_all_transcripts(
         
         cursor.execute(sql, params)
         
-        return [dict(row) for row in cursor.fetchall()]
+        results = []
+        for row in cursor.fetchall():
+            transcript = dict(row)
+            transcript['raw_html'] = decompress_html(transcript['raw_html'])
+            results.append(transcript)
+        return results
 
 
 def get_transcript_with_segments(transcript_id: str) -> Optional[Dict]:
@@ -339,6 +424,7 @@ def get_transcript_with_segments(transcript_id: str) -> Optional[Dict]:
             return None
         
         result = dict(transcript)
+        result['raw_html'] = decompress_html(result['raw_html'])
         
         cursor.execute("""
             SELECT * FROM segments 
@@ -5,13 +5,19 @@ Scrapes transcripts from Roll Call Factbase
 
 import re
 import json
+import codecs
+import gzip
 import time
 import hashlib
 from datetime import datetime
 from typing import List, Dict, Optional, Tuple
 from dataclasses import dataclass
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
 
+from database import compress_html, decompress_html
+
 # For running locally, you'll need:
 # pip install requests beautifulsoup4 lxml aiohttp
 
@@ -23,8 +29,21 @@ except ImportError:
     HAS_REQUESTS = False
     print("Warning: requests/beautifulsoup4 not installed. Run: pip install requests beautifulsoup4 lxml")
 
+# Optional: lets urllib3 decode brotli-encoded responses
+try:
+    import brotli  # noqa: F401
+    HAS_BROTLI = True
+except ImportError:
+    HAS_BROTLI = False
+
+# On-disk cache of fetched pages, revalidated with conditional GETs
+PAGE_CACHE_DIR = Path(__file__).parent.parent / "data" / "page_cache"
+
+# Read size when streaming page bodies
+STREAM_CHUNK_SIZE = 64 * 1024
 
-@dataclass
+
+@dataclass(slots=True)
 class TranscriptSegment:
     speaker: str
     start_time: str
@@ -37,7 +56,7 @@ class TranscriptSegment:
     headshot_url: str = None
 
 
-@dataclass  
+@dataclass(slots=True)
 class Transcript:
     id: str
     url: str
@@ -49,7 +68,73 @@ class Transcript:
     segments: List[TranscriptSegment]
     topics: List[str] = None
     entities: List[str] = None
-    raw_html: str = None
+    raw_html_compressed: bytes = None
+    
+    @property
+    def raw_html(self) -> Optional[str]:
+        """Raw page HTML, decompressed on access."""
+        return decompress_html(self.raw_html_compressed)
+
+
+# Month names/abbreviations (lower-cased) -> month number, for title dates
+_MONTHS = {
+    name: number
+    for number, names in enumerate([
+        ('january', 'jan'), ('february', 'feb'), ('march', 'mar'), ('april', 'apr'),
+        ('may',), ('june', 'jun'), ('july', 'jul'), ('august', 'aug'),
+        ('september', 'sep'), ('october', 'oct'), ('november', 'nov'), ('december', 'dec'),
+    ], 1)
+    for name in names
+}
+
+# "January 19, 2025" / "Jan 19 2025"
+_DATE_PARSE_RE = re.compile(r'([A-Za-z]+)\s+(\d{1,2})(?:,\s+|\s+)(\d{4})')
+
+
+@lru_cache(maxsize=4096)
+def _parse_title_cached(title: str) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+    """
+    Parse transcript title for metadata.
+    Returns (event_type, location, date). Memoized since recurring events
+    (e.g. press briefings) share title shapes across re-imports.
+    """
+    event_type = None
+    location = None
+    date = None
+    
+    # Common patterns:
+    # "Speech: Donald Trump Holds a Political Rally in Washington - January 19, 2025"
+    # "Press Briefing: Karoline Leavitt Holds a Press Briefing at The White House - January 28, 2025"
+    # "Interview: JD Vance on Fox News - September 6, 2025"
+    
+    # Extract event type (before the colon)
+    if ':' in title:
+        event_type = title.split(':')[0].strip()
+    
+    # Extract date (after the last dash)
+    date_match = re.search(r'-\s*(\w+\s+\d+,?\s*\d{4})\s*$', title)
+    if date_match:
+        # Equivalent to strptime with '%B %d, %Y', '%B %d %Y', '%b %d, %Y', '%b %d %Y'
+        parts = _DATE_PARSE_RE.fullmatch(date_match.group(1).strip())
+        month = _MONTHS.get(parts.group(1).lower()) if parts else None
+        if month:
+            try:
+                date = datetime(int(parts.group(3)), month, int(parts.group(2))).strftime('%Y-%m-%d')
+            except ValueError:
+                pass
+    
+    # Extract location (typically "in <Location>" pattern)
+    location_match = re.search(r'\s+in\s+([^-]+?)(?:\s+-|\s*$)', title)
+    if location_match:
+        location = location_match.group(1).strip()
+    
+    # Also check for "at <Location>" pattern
+    if not location:
+        location_match = re.search(r'\s+at\s+([^-]+?)(?:\s+-|\s*$)', title)
+        if location_match:
+            location = location_match.group(1).strip()
+    
+    return event_type, location, date
 
 
 class FactbaseScraper:
@@ -69,29 +154,74 @@ class FactbaseScraper:
         'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
         'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
         'Accept-Language': 'en-US,en;q=0.5',
+        # Only advertise br when we can decode it
+        'Accept-Encoding': 'gzip, deflate, br' if HAS_BROTLI else 'gzip, deflate',
         'Connection': 'keep-alive',
     }
     
-    def __init__(self, delay_between_requests: float = 1.0):
+    def __init__(self, delay_between_requests: float = 1.0, cache_dir: Optional[Path] = PAGE_CACHE_DIR):
         self.delay = delay_between_requests
+        self.cache_dir = cache_dir
+        if self.cache_dir:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
         self.session = requests.Session() if HAS_REQUESTS else None
         if self.session:
             self.session.headers.update(self.HEADERS)
     
+    def _cache_paths(self, url: str) -> Tuple[Path, Path]:
+        """Paths of the cached body and its validators (ETag/Last-Modified) for a URL."""
+        key = hashlib.md5(url.encode()).hexdigest()
+        return self.cache_dir / f"{key}.html.gz", self.cache_dir / f"{key}.meta.json"
+    
     def _get_page(self, url: str) -> Optional[str]:
-        """Fetch a page with rate limiting."""
+        """
+        Fetch a page with rate limiting.
+        Sends If-None-Match/If-Modified-Since when a cached copy exists and
+        serves the cached HTML on 304 Not Modified.
+        """
         if not self.session:
             raise RuntimeError("requests library not available")
         
         time.sleep(self.delay)
         
+        headers = {}
+        body_path = meta_path = None
+        if self.cache_dir:
+            body_path, meta_path = self._cache_paths(url)
+            if body_path.exists() and meta_path.exists():
+                meta = json.loads(meta_path.read_text())
+                if meta.get('etag'):
+                    headers['If-None-Match'] = meta['etag']
+                if meta.get('last_modified'):
+                    headers['If-Modified-Since'] = meta['last_modified']
+        
         try:
-            response = self.session.get(url, timeout=30)
-            response.raise_for_status()
-            return response.text
+            with self.session.get(url, timeout=30, headers=headers, stream=True) as response:
+                if response.status_code == 304 and headers:
+                    return gzip.decompress(body_path.read_bytes()).decode('utf-8')
+                response.raise_for_status()
+                html = self._read_text(response)
         except Exception as e:
             print(f"Error fetching {url}: {e}")
             return None
+        
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if self.cache_dir and (etag or last_modified):
+            body_path.write_bytes(gzip.compress(html.encode('utf-8')))
+            meta_path.write_text(json.dumps({'etag': etag, 'last_modified': last_modified}))
+        
+        return html
+    
+    def _read_text(self, response) -> str:
+        """
+        Decode a streamed response body chunk by chunk, so the full raw byte
+        buffer is never held alongside the decoded text.
+        """
+        decoder = codecs.getincrementaldecoder(response.encoding or 'utf-8')(errors='replace')
+        parts = [decoder.decode(chunk) for chunk in response.iter_content(chunk_size=STREAM_CHUNK_SIZE)]
+        parts.append(decoder.decode(b'', final=True))
+        return ''.join(parts)
     
     def get_transcript_urls_from_search(self, person: str = 'trump', max_pages: int = 50) -> List[str]:
         """
@@ -150,11 +280,8 @@ class FactbaseScraper:
             return None
         
         # Determine primary speaker (most words spoken)
-        primary_speaker = max(
-            speakers_data.keys(),
-            key=lambda s: speakers_data.get(s, {}).get('words', 0),
-            default='Unknown'
-        )
+        pairs = [(name, info.get('words', 0)) for name, info in speakers_data.items()]
+        primary_speaker = max(pairs, key=itemgetter(1), default=('Unknown', 0))[0]
         
         return Transcript(
             id=transcript_id,
@@ -167,54 +294,12 @@ class FactbaseScraper:
             segments=segments,
             topics=topics,
             entities=entities,
-            raw_html=html
+            raw_html_compressed=compress_html(html)
         )
     
     def _parse_title(self, title: str) -> Dict:
         """Parse transcript title for metadata."""
-        result = {
-            'event_type': None,
-            'location': None,
-            'date': None
-        }
-        
-        # Common patterns:
-        # "Speech: Donald Trump Holds a Political Rally in Washington - January 19, 2025"
-        # "Press Briefing: Karoline Leavitt Holds a Press Briefing at The White House - January 28, 2025"
-        # "Interview: JD Vance on Fox News - September 6, 2025"
-        
-        # Extract event type (before the colon)
-        if ':' in title:
-            result['event_type'] = title.split(':')[0].strip()
-        
-        # Extract date (after the last dash)
-        date_match = re.search(r'-\s*(\w+\s+\d+,?\s*\d{4})\s*$', title)
-        if date_match:
-            date_str = date_match.group(1)
-            try:
-                # Parse various date formats
-                for fmt in ['%B %d, %Y', '%B %d %Y', '%b %d, %Y', '%b %d %Y']:
-                    try:
-                        dt = datetime.strptime(date_str.strip(), fmt)
-                        result['date'] = dt.strftime('%Y-%m-%d')
-                        break
-                    except ValueError:
-                        continue
-            except Exception:
-                pass
-        
-        # Extract location (typically "in <Location>" pattern)
-        location_match = re.search(r'\s+in\s+([^-]+?)(?:\s+-|\s*$)', title)
-        if location_match:
-            result['location'] = location_match.group(1).strip()
-        
-        # Also check for "at <Location>" pattern
-        if not result['location']:
-            location_match = re.search(r'\s+at\s+([^-]+?)(?:\s+-|\s*$)', title)
-            if location_match:
-                result['location'] = location_match.group(1).strip()
-        
-        return result
+        return dict(zip(('event_type', 'location', 'date'), _parse_title_cached(title)))
     
     def _extract_speakers(self, soup: BeautifulSoup) -> Dict:
         """Extract speaker information from the page."""
@@ -222,7 +307,7 @@ class FactbaseScraper:
         
         # Look for speaker cards/sections
         # They typically have headshots and word/time counts
-        speaker_sections = soup.find_all(['div', 'section'], class_=lambda x: x and 'speaker' in x.lower() if x else False)
+        speaker_sections = soup.select('div[class*="speaker" i], section[class*="speaker" i]')
         
         for section in speaker_sections:
             # Try to extract speaker name
@@ -318,7 +403,7 @@ class FactbaseScraper:
         topics = []
         
         # Look for topic links
-        topic_links = soup.find_all('a', href=lambda x: x and 'topic=' in x if x else False)
+        topic_links = soup.select('a[href*="topic="]')
         for link in topic_links:
             topics.append(link.get_text(strip=True))
         
@@ -329,7 +414,7 @@ class FactbaseScraper:
         entities = []
         
         # Look for entities section
-        entities_section = soup.find(['div', 'section'], class_=lambda x: x and 'entit' in x.lower() if x else False)
+        entities_section = soup.select_one('div[class*="entit" i], section[class*="entit" i]')
         if entities_section:
             for elem in entities_section.find_all(['a', 'span', 'li']):
                 text = elem.get_text(strip=True)
@@ -365,6 +450,7 @@ def parse_transcript_from_html(html: str, url: str) -> Optional[Dict]:
     """
     scraper = FactbaseScraper.__new__(FactbaseScraper)
     scraper.delay = 0
+    scraper.cache_dir = None
     scraper.session = None
     
     transcript = scraper.parse_transcript_page(html, url)
@@ -400,7 +486,7 @@ def parse_transcript_from_html(html: str, url: str) -> Optional[Dict]:
 
 # Known transcript URLs (can be expanded)
 # These are manually compiled from search results and can be used as a starting point
-KNOWN_TRANSCRIPT_URLS = [
+KNOWN_TRANSCRIPT_URLS = (
     # Trump 2025 transcripts
     "https://rollcall.com/factbase/trump/transcript/donald-trump-speech-political-rally-washington-january-19-2025/",
     "https://rollcall.com/factbase/trump/transcript/donald-trump-speech-commencement-address-west-point-usma-may-24-2025/",
@@ -434,7 +520,10 @@ KNOWN_TRANSCRIPT_URLS = [
     "https://rollcall.com/factbase/trump/transcript/donald-trump-press-conference-briefing-karoline-leavitt-july-7-2025/",
     "https://rollcall.com/factbase/trump/transcript/donald-trump-press-conference-briefing-karoline-leavitt-august-12-2025/",
     "https://rollcall.com/factbase/trump/transcript/donald-trump-press-conference-briefing-karoline-leavitt-august-28-2025/",
-]
+)
+
+# Set view for O(1) "is this URL already known?" checks
+KNOWN_TRANSCRIPT_URLS_SET = frozenset(KNOWN_TRANSCRIPT_URLS)
 
 
 if __name__ == "__main__":
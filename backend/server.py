@@ -1,12 +1,15 @@
 """
-Mention Markets - Flask API Server
+Mention Markets - FastAPI Server
 REST API for serving transcript data
 """
 
 import os
 import json
-from flask import Flask, request, jsonify, send_from_directory
-from flask_cors import CORS
+from typing import Any, Optional
+from fastapi import Body, FastAPI, Request
+from fastapi.exceptions import RequestValidationError
+from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import FileResponse, JSONResponse
 from pathlib import Path
 
 # Import our database module
@@ -23,38 +26,69 @@ from database import (
     DATABASE_PATH
 )
 
-app = Flask(__name__, static_folder='../frontend/dist', static_url_path='')
-CORS(app)
+STATIC_FOLDER = Path(__file__).parent.parent / 'frontend' / 'dist'
+INDEX_FILE = STATIC_FOLDER / 'index.html'
+
+# Sync (def) handlers run in FastAPI's threadpool, so a slow sqlite query
+# no longer ties up the whole worker the way a sync WSGI worker did.
+app = FastAPI(title='Mention Markets API')
+app.add_middleware(CORSMiddleware, allow_origins=['*'], allow_methods=['*'], allow_headers=['*'])
+
+
+def error_response(message: str, status_code: int) -> JSONResponse:
+    """Error payload in the same {'error': ...} shape the frontend expects."""
+    return JSONResponse({'error': message}, status_code=status_code)
+
+
+def index_response():
+    """The SPA shell, or a 404 when the frontend has not been built."""
+    if not INDEX_FILE.is_file():
+        return error_response('Not found', 404)
+    return FileResponse(INDEX_FILE)
+
+
+@app.exception_handler(RequestValidationError)
+def validation_error(request: Request, exc: RequestValidationError) -> JSONResponse:
+    """Report bad query params (e.g. limit=abc) in the usual error shape."""
+    problems = '; '.join(f"{err['loc'][-1]}: {err['msg']}" for err in exc.errors())
+    return error_response(f'Invalid request: {problems}', 400)
 
 # Initialize database on startup
 if not DATABASE_PATH.exists():
     init_database()
 
 
-@app.route('/')
+@app.get('/')
 def serve_frontend():
     """Serve the frontend application."""
-    return send_from_directory(app.static_folder, 'index.html')
+    return index_response()
 
 
-@app.route('/api/health')
+@app.get('/api/health')
 def health_check():
     """Health check endpoint."""
-    return jsonify({'status': 'healthy', 'database': str(DATABASE_PATH)})
+    return {'status': 'healthy', 'database': str(DATABASE_PATH)}
 
 
-@app.route('/api/stats')
+@app.get('/api/stats')
 def get_stats():
     """Get database statistics."""
     try:
-        stats = get_database_stats()
-        return jsonify(stats)
+        return get_database_stats()
     except Exception as e:
-        return jsonify({'error': str(e)}), 500
+        return error_response(str(e), 500)
 
 
-@app.route('/api/search')
-def search():
+@app.get('/api/search')
+def search(
+    q: str = '',
+    speaker: Optional[str] = None,
+    type: Optional[str] = None,
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    limit: int = 100,
+    offset: int = 0
+):
     """
     Search transcripts.
     Query params:
@@ -66,52 +100,56 @@ def search():
     - limit: max results (default 100)
     - offset: pagination offset (default 0)
     """
-    query = request.args.get('q', '').strip()
+    query = q.strip()
     
     if not query:
-        return jsonify({'error': 'Search query (q) is required'}), 400
+        return error_response('Search query (q) is required', 400)
     
     try:
         results = search_segments(
             query=query,
-            speaker=request.args.get('speaker'),
-            event_type=request.args.get('type'),
-            start_date=request.args.get('start_date'),
-            end_date=request.args.get('end_date'),
-            limit=int(request.args.get('limit', 100)),
-            offset=int(request.args.get('offset', 0))
+            speaker=speaker,
+            event_type=type,
+            start_date=start_date,
+            end_date=end_date,
+            limit=limit,
+            offset=offset
         )
         
-        return jsonify({
+        return {
             'query': query,
             'count': len(results),
             'results': results
-        })
+        }
     except Exception as e:
-        return jsonify({'error': str(e)}), 500
+        return error_response(str(e), 500)
 
 
-@app.route('/api/analytics')
-def analytics():
+@app.get('/api/analytics')
+def analytics(q: str = ''):
     """
     Get mention analytics for a search term.
     Query params:
     - q: search query (required)
     """
-    query = request.args.get('q', '').strip()
+    query = q.strip()
     
     if not query:
-        return jsonify({'error': 'Search query (q) is required'}), 400
+        return error_response('Search query (q) is required', 400)
     
     try:
-        data = get_mention_analytics(query)
-        return jsonify(data)
+        return get_mention_analytics(query)
     except Exception as e:
-        return jsonify({'error': str(e)}), 500
+        return error_response(str(e), 500)
 
 
-@app.route('/api/transcripts')
-def list_transcripts():
+@app.get('/api/transcripts')
+def list_transcripts(
+    speaker: Optional[str] = None,
+    type: Optional[str] = None,
+    limit: int = 100,
+    offset: int = 0
+):
     """
     List all transcripts.
     Query params:
@@ -122,70 +160,68 @@ def list_transcripts():
     """
     try:
         transcripts = get_all_transcripts(
-            speaker=request.args.get('speaker'),
-            event_type=request.args.get('type'),
-            limit=int(request.args.get('limit', 100)),
-            offset=int(request.args.get('offset', 0))
+            speaker=speaker,
+            event_type=type,
+            limit=limit,
+            offset=offset
         )
         
-        return jsonify({
+        return {
             'count': len(transcripts),
             'transcripts': transcripts
-        })
+        }
     except Exception as e:
-        return jsonify({'error': str(e)}), 500
+        return error_response(str(e), 500)
 
 
-@app.route('/api/transcripts/<transcript_id>')
-def get_transcript(transcript_id):
+@app.get('/api/transcripts/{transcript_id}')
+def get_transcript(transcript_id: str):
     """Get a single transcript with all segments."""
     try:
         transcript = get_transcript_with_segments(transcript_id)
         
         if not transcript:
-            return jsonify({'error': 'Transcript not found'}), 404
+            return error_response('Transcript not found', 404)
         
-        return jsonify(transcript)
+        return transcript
     except Exception as e:
-        return jsonify({'error': str(e)}), 500
+        return error_response(str(e), 500)
 
 
-@app.route('/api/speakers')
+@app.get('/api/speakers')
 def list_speakers():
     """Get all speakers with their stats."""
     try:
         speakers = get_all_speakers()
-        return jsonify({'speakers': speakers})
+        return {'speakers': speakers}
     except Exception as e:
-        return jsonify({'error': str(e)}), 500
+        return error_response(str(e), 500)
 
 
-@app.route('/api/event-types')
+@app.get('/api/event-types')
 def list_event_types():
     """Get all event types."""
     try:
         types = get_all_event_types()
-        return jsonify({'event_types': types})
+        return {'event_types': types}
     except Exception as e:
-        return jsonify({'error': str(e)}), 500
+        return error_response(str(e), 500)
 
 
-@app.route('/api/import', methods=['POST'])
-def import_transcript():
+@app.post('/api/import')
+def import_transcript(data: Any = Body(None)):
     """
     Import a transcript from parsed data.
     POST body should be JSON with transcript data.
     """
     try:
-        data = request.get_json()
-        
         if not data:
-            return jsonify({'error': 'No data provided'}), 400
+            return error_response('No data provided', 400)
         
         required_fields = ['id', 'url', 'title', 'primary_speaker', 'segments']
         missing = [f for f in required_fields if f not in data]
         if missing:
-            return jsonify({'error': f'Missing required fields: {missing}'}), 400
+            return error_response(f'Missing required fields: {missing}', 400)
         
         transcript_id = insert_transcript(
             transcript_id=data['id'],
@@ -201,26 +237,24 @@ def import_transcript():
             raw_html=data.get('raw_html')
         )
         
-        return jsonify({
+        return {
             'success': True,
             'transcript_id': transcript_id,
             'segments_count': len(data['segments'])
-        })
+        }
     except Exception as e:
-        return jsonify({'error': str(e)}), 500
+        return error_response(str(e), 500)
 
 
-@app.route('/api/import/bulk', methods=['POST'])
-def import_bulk():
+@app.post('/api/import/bulk')
+def import_bulk(data: Any = Body(None)):
     """
     Import multiple transcripts at once.
     POST body should be JSON array of transcript data.
     """
     try:
-        data = request.get_json()
-        
         if not data or not isinstance(data, list):
-            return jsonify({'error': 'Expected JSON array of transcripts'}), 400
+            return error_response('Expected JSON array of transcripts', 400)
         
         results = []
         for transcript in data:
@@ -243,31 +277,37 @@ def import_bulk():
         
         success_count = sum(1 for r in results if r['success'])
         
-        return jsonify({
+        return {
             'total': len(data),
             'success': success_count,
             'failed': len(data) - success_count,
             'results': results
-        })
+        }
     except Exception as e:
-        return jsonify({'error': str(e)}), 500
+        return error_response(str(e), 500)
 
 
-# Catch-all route for SPA
-@app.route('/<path:path>')
-def catch_all(path):
+# Catch-all route for SPA (registered last so /api routes win)
+@app.get('/{path:path}')
+def catch_all(path: str):
     """Serve static files or fall back to index.html for SPA routing."""
-    file_path = Path(app.static_folder) / path
-    if file_path.exists():
-        return send_from_directory(app.static_folder, path)
-    return send_from_directory(app.static_folder, 'index.html')
+    # Unknown API endpoints are real 404s, not client-side routes
+    if path == 'api' or path.startswith('api/'):
+        return error_response('Not found', 404)
+    file_path = (STATIC_FOLDER / path).resolve()
+    if file_path.is_file() and STATIC_FOLDER.resolve() in file_path.parents:
+        return FileResponse(file_path)
+    return index_response()
 
 
 if __name__ == '__main__':
+    import uvicorn
+    
     port = int(os.environ.get('PORT', 5000))
     debug = os.environ.get('DEBUG', 'true').lower() == 'true'
+    workers = 1 if debug else int(os.environ.get('WEB_CONCURRENCY', 4))
     
     print(f"Starting Mention Markets API server on port {port}")
     print(f"Database: {DATABASE_PATH}")
     
-    app.run(host='0.0.0.0', port=port, debug=debug)
+    uvicorn.run('server:app', host='0.0.0.0', port=port, reload=debug, workers=workers)
@@ -8,11 +8,52 @@ import sqlite3
 import sys
 import re
 import json
-from typing import Tuple, Dict
+from typing import Tuple, Dict, Optional
 
 # Import normalization functions
 from rollcall_sync import normalize_speaker_label, strip_rollcall_artifacts
 
+# Line patterns used by normalize_existing_transcript (compiled once)
+SPEAKER_RE = re.compile(r'^[A-Z][a-zA-Z\s\.]+(\s+\d{1,2})?$')
+TS_RE = re.compile(r'^\d{1,2}:\d{2}-')
+RATING_RE = re.compile(r'^(NO STRESSLENS|NO SIGNAL|MEDIUM|WEAK|STRONG)')
+ANNOT_RE = re.compile(r'(?i)\[(?:Inaudible|Laughter|Laughs|Audience|Crosstalk|Applause).*?\]')
+
+# Lower-cased speaker labels that count toward trump_word_count
+TRUMP_KEYS = frozenset({
+    'trump',
+    'donald trump',
+    'donald j. trump',
+    'president trump',
+    'president donald trump',
+    'president donald j. trump',
+})
+
+# Any sign of un-normalized RollCall output, found in a single scan
+NEEDS_CLEAN_PATTERNS = (
+    ('sfx', r'(?:Donald Trump|Trump)\s+\d{2}'),
+    ('rat', r'NO SIGNAL|NO STRESSLENS|MEDIUM|WEAK'),
+    ('ts', r'\d{1,2}:\d{2}-\d{1,2}:\d{2}:\d{2}'),
+)
+NEEDS_CLEAN_RE = re.compile('|'.join(f'(?P<{key}>{pattern})' for key, pattern in NEEDS_CLEAN_PATTERNS))
+
+NEEDS_CLEAN_REASONS = {
+    'sfx': 'Has speaker numeric suffixes',
+    'rat': 'Has rating metadata',
+    'ts': 'Has timestamp lines',
+}
+
+# Write-back for a normalized transcript
+UPDATE_TRANSCRIPT_SQL = """
+    UPDATE transcripts
+    SET full_dialogue = ?,
+        speakers_json = ?,
+        word_count = ?,
+        trump_word_count = ?,
+        scraped_at = CURRENT_TIMESTAMP
+    WHERE id = ?
+"""
+
 def normalize_existing_transcript(full_dialogue: str) -> Tuple[str, str, int, int, Dict]:
     """
     Normalize an existing transcript's full_dialogue text
@@ -36,25 +77,32 @@ def normalize_existing_transcript(full_dialogue: str) -> Tuple[str, str, int, in
     }
     
     lines = full_dialogue.split('\n')
-    cleaned_sections = []
+    n_lines = len(lines)
+    # Flat list of output pieces, joined once at the end
+    parts = []
     speakers = set()
+    word_count = 0
     trump_word_count = 0
     
+    # Blank checks use `not raw or raw.isspace()` (same as `not raw.strip()`)
+    # so whitespace-only lines never allocate a stripped copy
     i = 0
-    while i < len(lines):
-        line = lines[i].strip()
+    while i < n_lines:
+        raw = lines[i]
         
         # Skip empty
-        if not line:
+        if not raw or raw.isspace():
             i += 1
             continue
         
+        line = raw.strip()
+        
         # Check if speaker line (has " 00" suffix or timestamp pattern follows)
         is_speaker = False
         clean_speaker = None
         
         # Pattern: "Name Name 00" or just "Name Name"
-        if re.match(r'^[A-Z][a-zA-Z\s\.]+(\s+\d{1,2})?$', line):
+        if SPEAKER_RE.match(line):
             raw_speaker = line
             clean_speaker, was_modified = normalize_speaker_label(raw_speaker)
             if was_modified:
@@ -66,40 +114,41 @@ def normalize_existing_transcript(full_dialogue: str) -> Tuple[str, str, int, in
             i += 1
             
             # Skip timestamp line
-            if i < len(lines) and re.match(r'^\d{1,2}:\d{2}-', lines[i]):
+            if i < n_lines and TS_RE.match(lines[i]):
                 stats['timestamp_lines'] += 1
                 i += 1
             
             # Skip blank
-            while i < len(lines) and not lines[i].strip():
+            while i < n_lines and (not lines[i] or lines[i].isspace()):
                 i += 1
             
             # Skip rating line
-            if i < len(lines) and re.match(r'^(NO STRESSLENS|NO SIGNAL|MEDIUM|WEAK|STRONG)', lines[i]):
+            if i < n_lines and RATING_RE.match(lines[i]):
                 stats['rating_lines'] += 1
                 i += 1
             
             # Collect dialogue until next speaker
             dialogue_lines = []
-            while i < len(lines):
-                current_line = lines[i].strip()
+            while i < n_lines:
+                raw = lines[i]
+                if not raw or raw.isspace():
+                    i += 1
+                    continue
+                current_line = raw.strip()
                 
                 # Stop at next speaker
-                if re.match(r'^[A-Z][a-zA-Z\s\.]+(\s+\d{1,2})?$', current_line):
+                if SPEAKER_RE.match(current_line):
                     break
                 
                 # Skip metadata
-                if re.match(r'^\d{1,2}:\d{2}-', current_line):
+                if TS_RE.match(current_line):
                     stats['timestamp_lines'] += 1
                     i += 1
                     continue
-                if re.match(r'^(NO STRESSLENS|NO SIGNAL|MEDIUM|WEAK|STRONG)', current_line):
+                if RATING_RE.match(current_line):
                     stats['rating_lines'] += 1
                     i += 1
                     continue
-                if not current_line:
-                    i += 1
-                    continue
                 
                 # This is dialogue
                 dialogue_lines.append(current_line)
@@ -108,27 +157,52 @@ def normalize_existing_transcript(full_dialogue: str) -> Tuple[str, str, int, in
             # Clean and save
             if dialogue_lines:
                 dialogue_text = ' '.join(dialogue_lines)
-                # Remove annotations
-                annotation_count = len(re.findall(r'\[(?:Inaudible|Laughter|Laughs|Audience|Crosstalk|Applause).*?\]', dialogue_text, re.IGNORECASE))
-                stats['annotations_removed'] += annotation_count
-                dialogue_text = re.sub(r'\[(?:Inaudible|Laughter|Laughs|Audience|Crosstalk|Applause).*?\]', '', dialogue_text, flags=re.IGNORECASE)
-                dialogue_text = ' '.join(dialogue_text.split())  # Clean whitespace
+                # Remove annotations (and count them) in one pass; the
+                # literal '[' check skips the regex for annotation-free blocks
+                if '[' in dialogue_text:
+                    dialogue_text, annotation_count = ANNOT_RE.subn('', dialogue_text)
+                    stats['annotations_removed'] += annotation_count
+                # Clean whitespace; the token list doubles as the block's word count
+                tokens = dialogue_text.split()
+                dialogue_text = ' '.join(tokens)
                 
                 if dialogue_text:
-                    cleaned_sections.append(f"{clean_speaker}\n{dialogue_text}\n")
-                    if 'donald trump' in clean_speaker.lower() or clean_speaker.lower() == 'trump':
-                        trump_word_count += len(dialogue_text.split())
+                    parts.extend((clean_speaker, '\n', dialogue_text, '\n\n'))
+                    word_count += len(clean_speaker.split()) + len(tokens)
+                    if clean_speaker.lower() in TRUMP_KEYS:
+                        trump_word_count += len(tokens)
         else:
             i += 1
     
     # Build output
-    normalized_dialogue = '\n'.join(cleaned_sections)
-    word_count = len(normalized_dialogue.split())
+    # Blocks are separated by a blank line; the last one ends with a single newline
+    if parts:
+        parts[-1] = '\n'
+    normalized_dialogue = ''.join(parts)
     speakers_json = json.dumps(sorted(list(speakers)))
     
     return normalized_dialogue, speakers_json, word_count, trump_word_count, stats
 
-def clean_december_transcripts(db_path: str, dry_run: bool = False, quiet: bool = False):
+def find_cleaning_reason(full_dialogue: str) -> Optional[str]:
+    """
+    Return the key ('sfx', 'rat' or 'ts') of the earliest leftover RollCall
+    artifact in the text, or None if it is already clean
+    """
+    if not full_dialogue:
+        return None
+    
+    match = NEEDS_CLEAN_RE.search(full_dialogue)
+    return match.lastgroup if match else None
+
+def connect(db_path: str) -> sqlite3.Connection:
+    """
+    Open a connection for cleanup runs. Autocommit mode (transactions are
+    managed explicitly) with a larger statement cache for repeated UPDATEs.
+    """
+    return sqlite3.connect(db_path, isolation_level=None, cached_statements=256)
+
+def clean_december_transcripts(db_path: str, dry_run: bool = False, quiet: bool = False,
+                               conn: Optional[sqlite3.Connection] = None):
     """
     Clean all December 2025 transcripts in the database
     
@@ -136,6 +210,7 @@ def clean_december_transcripts(db_path: str, dry_run: bool = False, quiet: bool
         db_path: Path to transcripts.db
         dry_run: If True, show what would be changed but don't update
         quiet: If True, minimal output (for API calls)
+        conn: Open connection to reuse across calls (see connect()); left open
     """
     def log(msg):
         if not quiet:
@@ -148,7 +223,9 @@ def clean_december_transcripts(db_path: str, dry_run: bool = False, quiet: bool
     log(f"Mode: {'DRY RUN (no changes)' if dry_run else 'LIVE (will update database)'}")
     log("="*80 + "\n")
     
-    conn = sqlite3.connect(db_path)
+    owns_conn = conn is None
+    if owns_conn:
+        conn = connect(db_path)
     cursor = conn.cursor()
     
     # Find December 2025 transcripts
@@ -172,24 +249,20 @@ def clean_december_transcripts(db_path: str, dry_run: bool = False, quiet: bool
         'annotations_removed': 0
     }
     
+    # Normalized rows, written back in one batch after the loop
+    updates = []
+    
     for row in transcripts:
         transcript_id, title, date, url, full_dialogue, old_word_count = row
         
         log(f"\n[{date}] {title[:60]}...")
         
-        # Check if needs cleaning
-        needs_cleaning = False
-        if re.search(r'(Donald Trump|Trump)\s+\d{2}', full_dialogue or ''):
-            needs_cleaning = True
-            print(f"  ⚠️  Has speaker numeric suffixes")
-        if re.search(r'NO SIGNAL|NO STRESSLENS|MEDIUM|WEAK', full_dialogue or ''):
-            needs_cleaning = True
-            print(f"  ⚠️  Has rating metadata")
-        if re.search(r'\d{1,2}:\d{2}-\d{1,2}:\d{2}:\d{2}', full_dialogue or ''):
-            needs_cleaning = True
-            print(f"  ⚠️  Has timestamp lines")
+        # Check if needs cleaning (first leftover artifact found)
+        reason = find_cleaning_reason(full_dialogue)
+        if reason:
+            print(f"  ⚠️  {NEEDS_CLEAN_REASONS[reason]}")
         
-        if not needs_cleaning:
+        if not reason:
             print(f"  ✅ Already clean, skipping")
             total_stats['skipped_clean'] += 1
             continue
@@ -213,16 +286,8 @@ def clean_december_transcripts(db_path: str, dry_run: bool = False, quiet: bool
         
         # Update database
         if not dry_run:
-            cursor.execute("""
-                UPDATE transcripts
-                SET full_dialogue = ?,
-                    speakers_json = ?,
-                    word_count = ?,
-                    trump_word_count = ?,
-                    scraped_at = CURRENT_TIMESTAMP
-                WHERE id = ?
-            """, (normalized_dialogue, speakers_json, word_count, trump_word_count, transcript_id))
-            print(f"  ✅ Updated in database")
+            updates.append((normalized_dialogue, speakers_json, word_count, trump_word_count, transcript_id))
+            print(f"  ✅ Queued for update")
             total_stats['updated'] += 1
         else:
             print(f"  (would update in database)")
@@ -230,12 +295,16 @@ def clean_december_transcripts(db_path: str, dry_run: bool = False, quiet: bool
         total_stats['processed'] += 1
     
     if not dry_run:
+        # One write transaction, one executemany, one commit
+        cursor.execute("BEGIN IMMEDIATE")
+        cursor.executemany(UPDATE_TRANSCRIPT_SQL, updates)
         conn.commit()
-        log(f"\n✅ Changes committed to database")
+        log(f"\n✅ Changes committed to database ({len(updates)} transcripts updated)")
     else:
         log(f"\n(DRY RUN - no changes made)")
     
-    conn.close()
+    if owns_conn:
+        conn.close()
     
     # Print summary
     print("\n" + "="*80)
@@ -1,65 +1,103 @@
 import requests
-from bs4 import BeautifulSoup
-import time
+from selectolax.parser import HTMLParser
 import re
+import html
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from database import Database
-from text_analysis import analyze_word_frequency, count_words
+from http_utils import Throttle, mount_pool
+from text_analysis import analyze_text
+
+# <a ... href="...">text</a> links to /documents/ pages on listing pages (raw bytes);
+# shared with full_scraper via iter_doc_links
+DOC_LINK_RE = re.compile(rb'<a\s[^>]*?href=["\']([^"\']*/documents/[^"\']*)["\'][^>]*>(.*?)</a>', re.IGNORECASE | re.DOTALL)
+# Markup nested inside link text
+TAG_RE = re.compile(r'<[^>]+>')
+
+# Title keyword -> speech type, checked in priority order
+SPEECH_TYPE_KEYWORDS = (
+    ('tweet', 'Tweet Collection'),
+    ('press release', 'Press Release'),
+    ('remarks', 'Speech'),
+    ('speech', 'Speech'),
+    ('interview', 'Interview'),
+    ('statement', 'Statement'),
+    ('executive order', 'Executive Order'),
+    ('proclamation', 'Proclamation'),
+)
+
+def iter_doc_links(content, base_url):
+    """Yield (url, title) for each /documents/ link in a listing page's raw bytes"""
+    # Listing pages only need (href, text) pairs - no DOM is built
+    for match in DOC_LINK_RE.finditer(content):
+        href = html.unescape(match.group(1).decode('utf-8', 'replace'))
+        if not href.startswith('http'):
+            href = base_url + href
+        link_text = match.group(2).decode('utf-8', 'replace')
+        yield href, ' '.join(html.unescape(TAG_RE.sub('', link_text)).split())
+
 
 class ComprehensiveScraper:
     """
     Comprehensive scraper that gets Trump transcripts from American Presidency Project
     """
-    def __init__(self):
+    def __init__(self, max_workers=8):
+        self.max_workers = max_workers
         self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
         })
+        # One pooled connection per worker thread
+        mount_pool(self.session, pool_maxsize=max_workers)
         self.db = Database()
         self.delay = 2
         self.base_url = "https://www.presidency.ucsb.edu"
+        # Request starts delay/max_workers seconds apart across all workers
+        self.throttle = Throttle(self.delay / self.max_workers)
 
-    def fetch_page(self, url):
-        """Fetch a page"""
+    def fetch_raw(self, url):
+        """Fetch a page's raw bytes (safe to call from worker threads)"""
         try:
+            self.throttle.wait()
             response = self.session.get(url, timeout=30)
             response.raise_for_status()
-            time.sleep(self.delay)
-            return BeautifulSoup(response.content, 'lxml')
+            return response.content
         except Exception as e:
             print(f"Error fetching {url}: {e}")
             return None
 
+    def fetch_page(self, url):
+        """Fetch and parse a page (safe to call from worker threads)"""
+        content = self.fetch_raw(url)
+        return HTMLParser(content) if content is not None else None
+
     def get_all_document_pages(self):
         """Get all pages of Trump documents"""
         all_docs = []
+        seen_urls = set()
         page = 0
 
         while True:
             url = f"{self.base_url}/advanced-search?field-keywords=&field-keywords2=&field-keywords3=&from%5Bdate%5D=01-01-2016&to%5Bdate%5D=12-31-2024&person2=200301&items_per_page=100&page={page}"
 
             print(f"\nFetching page {page + 1}: {url}")
-            soup = self.fetch_page(url)
+            content = self.fetch_raw(url)
 
-            if not soup:
+            # Listing pages only need (href, text) pairs - scan the raw bytes
+            # instead of building a DOM; bail out early if no links at all
+            if not content or b'/documents/' not in content:
                 break
 
             # Find document links
-            doc_links = soup.find_all('a', href=re.compile(r'/documents/'))
             new_docs = []
 
-            for link in doc_links:
-                href = link.get('href', '')
-                if not href.startswith('http'):
-                    href = self.base_url + href
-
-                title = link.get_text(strip=True)
-
+            for href, title in iter_doc_links(content, self.base_url):
                 # Skip guidebooks and category pages
                 if 'guidebook' in title.lower() or 'category' in title.lower():
                     continue
 
-                if title and href not in [d['url'] for d in all_docs]:
+                if title and href not in seen_urls:
+                    seen_urls.add(href)
                     new_docs.append({
                         'url': href,
                         'title': title
@@ -83,21 +121,21 @@ class ComprehensiveScraper:
 
     def scrape_document(self, url):
         """Scrape a single document"""
-        soup = self.fetch_page(url)
-        if not soup:
+        tree = self.fetch_page(url)
+        if not tree:
             return None
 
         # Extract title
-        title_elem = soup.find('h1', class_='title')
+        title_elem = tree.css_first('h1.title')
         if not title_elem:
-            title_elem = soup.find('h1')
-        title = title_elem.get_text(strip=True) if title_elem else 'Unknown'
+            title_elem = tree.css_first('h1')
+        title = title_elem.text(strip=True) if title_elem else 'Unknown'
 
         # Extract date
         date = None
-        date_elem = soup.find('span', class_='date-display-single')
+        date_elem = tree.css_first('span.date-display-single')
         if date_elem:
-            date_text = date_elem.get_text(strip=True)
+            date_text = date_elem.text(strip=True)
             try:
                 # Try to parse date
                 date_obj = datetime.strptime(date_text, '%B %d, %Y')
@@ -106,34 +144,23 @@ class ComprehensiveScraper:
                 date = date_text
 
         # Extract content
-        content_div = soup.find('div', class_='field-docs-content')
+        content_div = tree.css_first('div.field-docs-content')
         if not content_div:
-            content_div = soup.find('div', class_='field-items')
+            content_div = tree.css_first('div.field-items')
 
         if not content_div:
             # Try to find paragraphs
-            paragraphs = soup.find_all('p')
-            full_text = ' '.join([p.get_text(strip=True) for p in paragraphs])
+            paragraphs = tree.css('p')
+            full_text = ' '.join([p.text(strip=True) for p in paragraphs])
         else:
-            full_text = content_div.get_text(strip=True, separator=' ')
+            full_text = content_div.text(separator=' ', strip=True)
 
-        # Determine speech type from title
-        speech_type = 'Document'
+        # Determine speech type from title (first matching keyword wins)
         title_lower = title.lower()
-        if 'tweet' in title_lower:
-            speech_type = 'Tweet Collection'
-        elif 'press release' in title_lower:
-            speech_type = 'Press Release'
-        elif 'remarks' in title_lower or 'speech' in title_lower:
-            speech_type = 'Speech'
-        elif 'interview' in title_lower:
-            speech_type = 'Interview'
-        elif 'statement' in title_lower:
-            speech_type = 'Statement'
-        elif 'executive order' in title_lower:
-            speech_type = 'Executive Order'
-        elif 'proclamation' in title_lower:
-            speech_type = 'Proclamation'
+        speech_type = next(
+            (label for keyword, label in SPEECH_TYPE_KEYWORDS if keyword in title_lower),
+            'Document'
+        )
 
         if not full_text or len(full_text) < 100:
             return None
@@ -176,45 +203,50 @@ class ComprehensiveScraper:
         success_count = 0
         skip_count = 0
 
-        for i, doc in enumerate(all_docs, 1):
-            print(f"\n[{i}/{len(all_docs)}] {doc['title'][:70]}...")
+        # Check which documents are already stored (one batched query)
+        existing = self.db.existing_urls(doc['url'] for doc in all_docs)
+        pending = [doc for doc in all_docs if doc['url'] not in existing]
+        skip_count = len(all_docs) - len(pending)
+        print(f"Already in database: {skip_count} | To scrape: {len(pending)}")
 
-            # Check if exists
-            if self.db.url_exists(doc['url']):
-                print("  ✓ Already in database")
-                skip_count += 1
-                continue
+        # Fetch and parse in worker threads; results come back in order and
+        # all database writes stay on this thread (sqlite connections aren't shared)
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            results = pool.map(self.scrape_document, [doc['url'] for doc in pending])
 
-            # Scrape content
-            content = self.scrape_document(doc['url'])
+            for i, (doc, content) in enumerate(zip(pending, results), 1):
+                print(f"\n[{i}/{len(pending)}] {doc['title'][:70]}...")
 
-            if not content:
-                print("  ✗ Failed to extract content")
-                continue
+                if not content:
+                    print("  ✗ Failed to extract content")
+                    continue
 
-            word_count = count_words(content['full_text'])
-            print(f"  Words: {word_count:,} | Type: {content['speech_type']}")
-
-            # Save to database
-            try:
-                transcript_id = self.db.insert_transcript(
-                    title=content['title'],
-                    date=content['date'],
-                    speech_type=content['speech_type'],
-                    location=content['location'],
-                    url=doc['url'],
-                    full_text=content['full_text'],
-                    word_count=word_count
-                )
-
-                if transcript_id:
-                    # Analyze words
-                    word_freqs = analyze_word_frequency(content['full_text'])
-                    self.db.insert_word_frequencies(transcript_id, word_freqs)
-                    print(f"  ✓ Saved (ID: {transcript_id})")
-                    success_count += 1
-            except Exception as e:
-                print(f"  ✗ Error saving: {e}")
+                # Word count and frequencies from one tokenization pass
+                word_count, word_freqs = analyze_text(content['full_text'])
+                print(f"  Words: {word_count:,} | Type: {content['speech_type']}")
+
+                # Save to database
+                try:
+                    transcript_id = self.db.insert_transcript(
+                        title=content['title'],
+                        date=content['date'],
+                        speech_type=content['speech_type'],
+                        location=content['location'],
+                        url=doc['url'],
+                        full_text=content['full_text'],
+                        word_count=word_count
+                    )
+
+                    if transcript_id:
+                        self.db.buffer_word_frequencies(transcript_id, word_freqs)
+                        print(f"  ✓ Saved (ID: {transcript_id})")
+                        success_count += 1
+                    else:
+                        print("  ✓ Already in database")
+                        skip_count += 1
+                    self.db.commit()
+                except Exception as e:
+                    print(f"  ✗ Error saving: {e}")
 
         print(f"\n{'='*80}")
         print(f"SCRAPING COMPLETE")
@@ -223,6 +255,9 @@ class ComprehensiveScraper:
         print(f"Already in DB: {skip_count} documents")
         print(f"Failed: {len(all_docs) - success_count - skip_count} documents")
 
+        # Write out any word frequencies still buffered
+        self.db.flush_word_freqs()
+
         stats = self.db.get_stats()
         print(f"\nDatabase Statistics:")
         print(f"  Total transcripts: {stats['total_transcripts']}")
@@ -1,7 +1,47 @@
 import sqlite3
 import os
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Dict, List, Tuple
+from typing import Dict, List, Set, Tuple
+
+# Connection tuning applied by Database.connect, in this order
+SQLITE_PRAGMAS = (
+    'page_size=8192',
+    'journal_mode=WAL',
+    'synchronous=NORMAL',
+    'temp_store=MEMORY',
+    'mmap_size=268435456',
+    'cache_size=-65536',
+)
+
+# Buffered word-frequency rows are written once this many have accumulated
+WORD_FREQ_FLUSH_ROWS = 10_000
+
+# Rows per multi-row INSERT: 333 * 3 params stays under SQLite's
+# historical 999 bound-parameter limit
+WORD_FREQ_ROWS_PER_INSERT = 333
+WORD_FREQ_INSERT_SQL = 'INSERT INTO word_frequencies (transcript_id, word, frequency) VALUES '
+
+# URLs per IN (...) lookup in existing_urls, also under the 999-parameter limit
+URL_LOOKUP_CHUNK = 900
+
+
+class WordFreqBuffer:
+    """Accumulates (transcript_id, word, frequency) rows across transcripts"""
+    def __init__(self, flush_rows: int = WORD_FREQ_FLUSH_ROWS):
+        self.flush_rows = flush_rows
+        self.rows: List[Tuple[int, str, int]] = []
+
+    def add(self, transcript_id: int, word_freqs: Dict[str, int]) -> bool:
+        """Buffer a transcript's frequencies; returns True once a flush is due"""
+        self.rows.extend((transcript_id, word, freq) for word, freq in word_freqs.items())
+        return len(self.rows) >= self.flush_rows
+
+    def drain(self) -> List[Tuple[int, str, int]]:
+        """Hand back all buffered rows and reset the buffer"""
+        rows, self.rows = self.rows, []
+        return rows
+
 
 class Database:
     def __init__(self, db_path='./data/transcripts.db'):
@@ -9,13 +49,45 @@ class Database:
         os.makedirs(os.path.dirname(db_path), exist_ok=True)
         self.conn = None
         self.cursor = None
+        self.word_freq_buffer = WordFreqBuffer()
 
     def connect(self):
         """Connect to the database"""
-        self.conn = sqlite3.connect(self.db_path)
+        # Larger statement cache: the scrapers cycle through a handful of
+        # INSERT/SELECT strings thousands of times
+        self.conn = sqlite3.connect(self.db_path, cached_statements=256)
         self.cursor = self.conn.cursor()
+        # page_size only applies to a brand-new file and must precede WAL;
+        # WAL + relaxed sync: one cheap fsync per transaction instead of several;
+        # mmap lets repeated index lookups read pages straight from the OS cache
+        for pragma in SQLITE_PRAGMAS:
+            self.cursor.execute(f'PRAGMA {pragma}')
         print(f"Connected to database: {self.db_path}")
 
+    def begin(self):
+        """Start an explicit write transaction (no-op if one is already open)"""
+        if not self.conn.in_transaction:
+            self.cursor.execute('BEGIN IMMEDIATE')
+
+    def commit(self):
+        """Commit the current transaction"""
+        self.conn.commit()
+
+    @contextmanager
+    def transaction(self):
+        """Run a group of writes under a single commit; rolls back on error"""
+        if self.conn.in_transaction:
+            # Already inside a batch - the outer transaction commits
+            yield
+            return
+        self.begin()
+        try:
+            yield
+        except BaseException:
+            self.conn.rollback()
+            raise
+        self.commit()
+
     def initialize(self):
         """Create database tables"""
         self.connect()
@@ -70,31 +142,58 @@ class Database:
 
     def insert_transcript(self, title: str, date: str, speech_type: str, location: str,
                          url: str, full_text: str, word_count: int) -> int:
-        """Insert a transcript and return its ID"""
-        try:
-            self.cursor.execute('''
-                INSERT INTO transcripts (title, date, speech_type, location, url, full_text, word_count)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-            ''', (title, date, speech_type, location, url, full_text, word_count))
-            self.conn.commit()
-            return self.cursor.lastrowid
-        except sqlite3.IntegrityError:
-            # URL already exists
-            return None
+        """
+        Insert a transcript and return its ID, or None if the URL is already
+        stored (not committed - see commit()/transaction())
+        """
+        # UNIQUE(url) does the dedup in the same statement
+        self.cursor.execute('''
+            INSERT OR IGNORE INTO transcripts (title, date, speech_type, location, url, full_text, word_count)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+        ''', (title, date, speech_type, location, url, full_text, word_count))
+        return self.cursor.lastrowid if self.cursor.rowcount else None
 
     def insert_word_frequencies(self, transcript_id: int, word_freqs: Dict[str, int]):
-        """Insert word frequencies for a transcript"""
+        """Insert word frequencies for a transcript (not committed - see commit()/transaction())"""
         data = [(transcript_id, word, freq) for word, freq in word_freqs.items()]
-        self.cursor.executemany('''
-            INSERT INTO word_frequencies (transcript_id, word, frequency)
-            VALUES (?, ?, ?)
-        ''', data)
-        self.conn.commit()
+        self._insert_word_freq_rows(data)
+
+    def buffer_word_frequencies(self, transcript_id: int, word_freqs: Dict[str, int]):
+        """Queue word frequencies; written in WORD_FREQ_FLUSH_ROWS batches by flush_word_freqs()"""
+        if self.word_freq_buffer.add(transcript_id, word_freqs):
+            self.flush_word_freqs()
+
+    def flush_word_freqs(self):
+        """Write all buffered word frequencies in a single transaction"""
+        rows = self.word_freq_buffer.drain()
+        if rows:
+            with self.transaction():
+                self._insert_word_freq_rows(rows)
+
+    def _insert_word_freq_rows(self, rows: List[Tuple[int, str, int]]):
+        """Insert rows as multi-row VALUES statements, WORD_FREQ_ROWS_PER_INSERT at a time"""
+        for start in range(0, len(rows), WORD_FREQ_ROWS_PER_INSERT):
+            chunk = rows[start:start + WORD_FREQ_ROWS_PER_INSERT]
+            # Full chunks reuse one SQL string, so sqlite3's statement cache hits
+            sql = WORD_FREQ_INSERT_SQL + ','.join(['(?, ?, ?)'] * len(chunk))
+            self.cursor.execute(sql, [value for row in chunk for value in row])
 
     def url_exists(self, url: str) -> bool:
         """Check if a URL already exists in the database"""
-        self.cursor.execute('SELECT id FROM transcripts WHERE url = ?', (url,))
-        return self.cursor.fetchone() is not None
+        # Answered from the UNIQUE(url) index alone - the table row is never read
+        self.cursor.execute('SELECT EXISTS(SELECT 1 FROM transcripts WHERE url = ?)', (url,))
+        return bool(self.cursor.fetchone()[0])
+
+    def existing_urls(self, urls: List[str]) -> Set[str]:
+        """Return the subset of urls already in the database, using batched IN queries"""
+        urls = list(urls)
+        found = set()
+        for start in range(0, len(urls), URL_LOOKUP_CHUNK):
+            chunk = urls[start:start + URL_LOOKUP_CHUNK]
+            placeholders = ','.join('?' * len(chunk))
+            self.cursor.execute(f'SELECT url FROM transcripts WHERE url IN ({placeholders})', chunk)
+            found.update(row[0] for row in self.cursor.fetchall())
+        return found
 
     def get_stats(self) -> Dict:
         """Get database statistics"""
@@ -112,5 +211,7 @@ class Database:
     def close(self):
         """Close database connection"""
         if self.conn:
+            self.flush_word_freqs()
+            self.conn.commit()
             self.conn.close()
             print("Database connection closed")
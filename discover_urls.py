@@ -8,100 +8,233 @@ Run this to build a complete list of URLs, then use import_data.py to fetch them
 """
 
 import requests
-import time
 import json
+import os
 import re
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 
+from http_utils import ACCEPT_ENCODING, Throttle, http_retry, mount_pool
+
+# Optional faster JSON encoder/decoder for the URL list
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# Optional on-disk HTTP cache so reruns don't repeat identical searches
+try:
+    from requests_cache import CachedSession
+    HAS_REQUESTS_CACHE = True
+except ImportError:
+    HAS_REQUESTS_CACHE = False
+
 # Output file for discovered URLs
 OUTPUT_FILE = Path(__file__).parent / "data" / "all_transcript_urls.json"
 
+# Hand-curated starting list, one URL per line (# comments allowed)
+KNOWN_URLS_FILE = Path(__file__).parent / "data" / "known_urls.txt"
+
+# Cached responses (only 200s) are reused for a day
+HTTP_CACHE_FILE = Path(__file__).parent / "data" / "http_cache.sqlite"
+HTTP_CACHE_EXPIRE_SECONDS = 24 * 60 * 60
+
 # Headers
 HEADERS = {
-    'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
+    'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36',
+    'Accept-Language': 'en-US,en;q=0.9',
+    'Accept-Encoding': ACCEPT_ENCODING,
 }
 
-# Google search to find URLs (we'll use DuckDuckGo HTML version which doesn't need API)
-def search_duckduckgo(query: str, max_results: int = 30) -> list:
-    """Search DuckDuckGo and extract URLs."""
-    urls = []
+# Transcript page links in search results and transcript pages
+TRANSCRIPT_URL_RE = re.compile(r'https://rollcall\.com/factbase/trump/transcript/[^"\'>\s]+')
+
+# Responses are scanned in chunks of this many bytes; the last STREAM_TAIL_CHARS
+# characters carry over so links split across chunks are still found
+STREAM_CHUNK_SIZE = 64 * 1024
+STREAM_TAIL_CHARS = 256
+
+# Searches/crawls in flight at once - the discovery pass is pure network wait
+MAX_CONCURRENT_REQUESTS = 16
+
+# Results on one DuckDuckGo HTML page; a search that fills it probably has more
+SEARCH_PAGE_RESULTS = 30
+
+# Seconds between request starts: DuckDuckGo throttles bursts of queries, and
+# transcript pages are crawled a little faster
+SEARCH_THROTTLE = Throttle(2.0)
+CRAWL_THROTTLE = Throttle(1.0)
+
+# Search engines throttle bursts, so allow up to 5 retries
+HTTP_RETRY = http_retry(total=5)
+
+# Shared keep-alive session: one TLS handshake per pooled connection
+# instead of one per search/crawl request
+if HAS_REQUESTS_CACHE:
+    SESSION = CachedSession(str(HTTP_CACHE_FILE), backend='sqlite', expire_after=HTTP_CACHE_EXPIRE_SECONDS,
+                            allowable_methods=('GET',), allowable_codes=(200,))
+else:
+    SESSION = requests.Session()
+SESSION.headers.update(HEADERS)
+mount_pool(SESSION, pool_maxsize=MAX_CONCURRENT_REQUESTS, pool_connections=4, max_retries=HTTP_RETRY)
+
+MONTHS = ['january', 'february', 'march', 'april', 'may', 'june',
+          'july', 'august', 'september', 'october', 'november', 'december']
+
+EVENT_TYPES = [
+    'rally', 'speech', 'press conference', 'interview',
+    'remarks', 'address', 'briefing', 'debate'
+]
+
+
+def fetch_all(func, items) -> list:
+    """Run func over items on a bounded thread pool; results keep input order."""
+    with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS) as pool:
+        return list(pool.map(func, items))
+
+
+def scan_transcript_urls(response) -> set:
+    """Collect transcript URLs from a streamed response without holding the whole body."""
+    if response.encoding is None:
+        response.encoding = 'utf-8'
+    
+    urls = set()
+    buf = ''
+    for chunk in response.iter_content(STREAM_CHUNK_SIZE, decode_unicode=True):
+        buf += chunk
+        keep_from = len(buf) - STREAM_TAIL_CHARS
+        for match in TRANSCRIPT_URL_RE.finditer(buf):
+            if match.end() < len(buf):
+                urls.add(match.group())
+            else:
+                # May continue in the next chunk - rescan it from its start
+                keep_from = min(keep_from, match.start())
+        buf = buf[max(keep_from, 0):]
     
+    urls.update(TRANSCRIPT_URL_RE.findall(buf))
+    return urls
+
+def paced_get(url: str, throttle: Throttle):
+    """Streamed GET that only waits on throttle when it has to go to the network."""
+    if HAS_REQUESTS_CACHE:
+        # Uncached (or expired) URLs come back as 504 without a request
+        response = SESSION.get(url, timeout=30, stream=True, only_if_cached=True)
+        if response.status_code != 504:
+            return response
+        response.close()
+    throttle.wait(url)
+    return SESSION.get(url, timeout=30, stream=True)
+
+
+# Google search to find URLs (we'll use DuckDuckGo HTML version which doesn't need API)
+def search_duckduckgo(query: str, max_results: int = 30):
+    """Search DuckDuckGo and extract URLs; None if the search failed (result unknown)."""
     # DuckDuckGo HTML search
     search_url = f"https://html.duckduckgo.com/html/?q={query}"
     
     try:
-        response = requests.get(search_url, headers=HEADERS, timeout=30)
-        
-        # Extract URLs from results
-        pattern = r'https://rollcall\.com/factbase/trump/transcript/[^"\'>\s]+'
-        found = re.findall(pattern, response.text)
-        urls.extend(found)
+        with paced_get(search_url, SEARCH_THROTTLE) as response:
+            # Throttled queries get a 202/403 challenge page instead of results
+            if response.status_code != 200:
+                print(f"Search error: HTTP {response.status_code} for {query[:60]}")
+                return None
+            # Extract URLs from results
+            return scan_transcript_urls(response)
         
     except Exception as e:
         print(f"Search error: {e}")
-    
-    return list(set(urls))
+        return None
+
+
+def load_url_file() -> dict:
+    """Read the saved URL list."""
+    raw = OUTPUT_FILE.read_bytes()
+    return orjson.loads(raw) if HAS_ORJSON else json.loads(raw)
 
 
-def discover_urls_by_year(year: int) -> list:
-    """Discover transcript URLs for a specific year."""
-    urls = []
+def save_url_file(urls) -> list:
+    """Write the sorted, de-duplicated URL list atomically; returns the list written."""
+    urls_list = sorted(set(urls))
+    data = {
+        'discovered_at': datetime.now().isoformat(),
+        'total_count': len(urls_list),
+        'urls': urls_list
+    }
     
-    # Search queries for this year
-    queries = [
+    OUTPUT_FILE.parent.mkdir(parents=True, exist_ok=True)
+    if HAS_ORJSON:
+        payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    else:
+        payload = json.dumps(data, indent=2).encode('utf-8')
+    
+    # Write a sibling temp file and swap it in, so a crash never leaves a
+    # half-written list behind
+    tmp = OUTPUT_FILE.with_suffix('.tmp')
+    tmp.write_bytes(payload)
+    os.replace(tmp, OUTPUT_FILE)
+    return urls_list
+
+
+def load_known_urls() -> list:
+    """Read the hand-curated URL list."""
+    lines = KNOWN_URLS_FILE.read_text().splitlines()
+    return [line.strip() for line in lines if line.strip() and not line.lstrip().startswith('#')]
+
+
+def year_queries(year: int) -> list:
+    """Whole-year search queries for a specific year."""
+    return [
         f'site:rollcall.com/factbase/trump/transcript {year}',
         f'site:rollcall.com "donald trump" transcript {year}',
     ]
-    
-    # Also search by month
-    months = ['january', 'february', 'march', 'april', 'may', 'june',
-              'july', 'august', 'september', 'october', 'november', 'december']
-    
-    for month in months:
-        queries.append(f'site:rollcall.com/factbase/trump/transcript {month} {year}')
-    
-    for query in queries:
-        print(f"  Searching: {query[:60]}...")
-        found = search_duckduckgo(query)
-        urls.extend(found)
-        time.sleep(2)  # Rate limiting
-    
-    return list(set(urls))
 
 
-def discover_urls_by_type() -> list:
+def month_queries(year: int) -> list:
+    """Month-by-month search queries for a specific year."""
+    return [f'site:rollcall.com/factbase/trump/transcript {month} {year}' for month in MONTHS]
+
+
+def search_years(queries: list, found_by_year: dict) -> set:
+    """
+    Run (year, query) searches concurrently, collecting URLs per year.
+    Returns the years whose results may be incomplete: a search failed, or
+    filled a whole results page (the rest only show up in narrower searches).
+    """
+    incomplete_years = set()
+    results = fetch_all(search_duckduckgo, [query for _, query in queries])
+    for (year, _), found in zip(queries, results):
+        if found is None or len(found) >= SEARCH_PAGE_RESULTS:
+            incomplete_years.add(year)
+        if found:
+            found_by_year[year].update(found)
+    return incomplete_years
+
+
+def discover_urls_by_type() -> set:
     """Discover transcript URLs by event type."""
-    urls = []
+    queries = [f'site:rollcall.com/factbase/trump/transcript {event_type}' for event_type in EVENT_TYPES]
     
-    event_types = [
-        'rally', 'speech', 'press conference', 'interview',
-        'remarks', 'address', 'briefing', 'debate'
-    ]
-    
-    for event_type in event_types:
-        print(f"  Searching event type: {event_type}")
-        query = f'site:rollcall.com/factbase/trump/transcript {event_type}'
-        found = search_duckduckgo(query)
-        urls.extend(found)
-        time.sleep(2)
-    
-    return list(set(urls))
+    urls = set()
+    for found in fetch_all(search_duckduckgo, queries):
+        if found:
+            urls.update(found)
+    return urls
 
 
-def crawl_transcript_page_for_links(url: str) -> list:
+def crawl_transcript_page_for_links(url: str) -> set:
     """Crawl a transcript page to find links to other transcripts."""
-    urls = []
+    urls = set()
     
     try:
-        response = requests.get(url, headers=HEADERS, timeout=30)
-        pattern = r'https://rollcall\.com/factbase/trump/transcript/[^"\'>\s]+'
-        found = re.findall(pattern, response.text)
-        urls.extend(found)
+        with paced_get(url, CRAWL_THROTTLE) as response:
+            urls = scan_transcript_urls(response)
     except Exception as e:
         print(f"Crawl error for {url}: {e}")
     
-    return list(set(urls))
+    return urls
 
 
 def main():
@@ -114,19 +247,33 @@ def main():
     
     # Load existing URLs if available
     if OUTPUT_FILE.exists():
-        with open(OUTPUT_FILE) as f:
-            data = json.load(f)
-            all_urls = set(data.get('urls', []))
-            print(f"Loaded {len(all_urls)} existing URLs")
+        data = load_url_file()
+        all_urls = set(data.get('urls', []))
+        print(f"Loaded {len(all_urls)} existing URLs")
     
     # Discover by year (2017-2025)
     print("\n[1/3] Discovering URLs by year...")
-    for year in range(2017, 2026):
-        print(f"\nYear {year}:")
-        urls = discover_urls_by_year(year)
+    years = range(2017, 2026)
+    found_by_year = defaultdict(set)
+    
+    # Whole-year searches for every year go out as one concurrent batch
+    queries = [(year, query) for year in years for query in year_queries(year)]
+    print(f"  Running {len(queries)} whole-year searches...")
+    incomplete_years = search_years(queries, found_by_year)
+    
+    # Month searches mostly repeat the whole-year results, so skip a year only
+    # when its whole-year searches all came back short of a page and found
+    # nothing new; failed or page-filling searches always drill down
+    fresh_years = [year for year in years if year in incomplete_years or found_by_year[year] - all_urls]
+    queries = [(year, query) for year in fresh_years for query in month_queries(year)]
+    print(f"  Running {len(queries)} month searches for {len(fresh_years)} of {len(years)} years...")
+    search_years(queries, found_by_year)
+    
+    for year in years:
+        urls = found_by_year[year]
         before = len(all_urls)
         all_urls.update(urls)
-        print(f"  Found {len(urls)} URLs, {len(all_urls) - before} new")
+        print(f"  Year {year}: found {len(urls)} URLs, {len(all_urls) - before} new")
     
     # Discover by event type
     print("\n[2/3] Discovering URLs by event type...")
@@ -138,24 +285,12 @@ def main():
     # Crawl known pages for more links
     print("\n[3/3] Crawling known pages for additional links...")
     urls_to_crawl = list(all_urls)[:50]  # Crawl first 50
-    for i, url in enumerate(urls_to_crawl):
-        if i % 10 == 0:
-            print(f"  Crawling page {i+1}/{len(urls_to_crawl)}...")
-        found = crawl_transcript_page_for_links(url)
+    print(f"  Crawling {len(urls_to_crawl)} pages...")
+    for found in fetch_all(crawl_transcript_page_for_links, urls_to_crawl):
         all_urls.update(found)
-        time.sleep(1)
     
     # Save results
-    OUTPUT_FILE.parent.mkdir(parents=True, exist_ok=True)
-    
-    urls_list = sorted(list(all_urls))
-    
-    with open(OUTPUT_FILE, 'w') as f:
-        json.dump({
-            'discovered_at': datetime.now().isoformat(),
-            'total_count': len(urls_list),
-            'urls': urls_list
-        }, f, indent=2)
+    urls_list = save_url_file(all_urls)
     
     print()
     print("=" * 60)
@@ -168,95 +303,16 @@ def main():
     print("  python3 import_all.py")
 
 
-# KNOWN URLS - Comprehensive list compiled from searches
-# This is a starting point - the discovery script will find more
-KNOWN_URLS = [
-    # 2017
-    "https://rollcall.com/factbase/trump/transcript/donald-trump-speech-washington-dc-january-20-2017/",
-    "https://rollcall.com/factbase/trump/transcript/donald-trump-remarks-uss-gerald-ford-march-2-2017/",
-    "https://rollcall.com/factbase/trump/transcript/donald-trump-speech-rally-harrisburg-pa-april-29-2017/",
-    "https://rollcall.com/factbase/trump/transcript/donald-trump-interview-nbc-lester-holt-may-11-2017/",
-    "https://rollcall.com/factbase/trump/transcript/donald-trump-remarks-veterans-act-charlottesville-august-12-2017/",
-    "https://rollcall.com/factbase/trump/transcript/donald-trump-press-conference-infrastructure-charlottesville-august-15-2017/",
-    "https://rollcall.com/factbase/trump/transcript/donald-trump-speech-united-nations-general-assembly-september-19-2017/",
-    "https://rollcall.com/factbase/trump/transcript/donald-trump-speech-luther-strange-rally-huntsville-alabama-september-22-2017/",
-    "https://rollcall.com/factbase/trump/transcript/donald-trump-interview-sean-hannity-october-11-2017/",
-    "https://rollcall.com/factbase/trump/transcript/donald-trump-speech-make-america-great-again-pensacola-december-8-2017/",
-    
-    # 2018
-    "https://rollcall.com/factbase/trump/transcript/donald-trump-remarks-march-for-life-january-19-2018/",
-    "https://rollcall.com/factbase/trump/transcript/donald-trump-remarks-national-prayer-breakfast-february-8-2018/",
-    "https://rollcall.com/factbase/trump/transcript/donald-trump-interview-sean-hannity-fox-june-12-2018/",
-    "https://rollcall.com/factbase/trump/transcript/donald-trump-speech-political-rally-duluth-minnesota-june-20-2018/",
-    "https://rollcall.com/factbase/trump/transcript/donald-trump-speech-make-america-great-again-rally-great-falls-montana-july-5-2018/",
-    "https://rollcall.com/factbase/trump/transcript/donald-trump-press-conference-vladimir-putin-helsinki-july-16-2018/",
-    "https://rollcall.com/factbase/trump/transcript/donald-trump-speech-us-steel-illinois-july-26-2018/",
-    "https://rollcall.com/factbase/trump/transcript/donald-trump-speech-un-general-assembly-september-25-2018/",
-    "https://rollcall.com/factbase/trump/transcript/donald-trump-speech-maga-rally-houston-tx-october-22-2018/",
-    "https://rollcall.com/factbase/trump/transcript/donald-trump-speech-future-farmers-america-indianapolis-october-27-2018/",
-    
-    # 2019
-    "https://rollcall.com/factbase/trump/transcript/donald-trump-speech-state-of-the-union-february-5-2019/",
-    "https://rollcall.com/factbase/trump/transcript/donald-trump-speech-cpac-march-2-2019/",
-    
-    # 2020
-    "https://rollcall.com/factbase/trump/transcript/donald-trump-speech-state-of-the-union-february-4-2020/",
-    "https://rollcall.com/factbase/trump/transcript/donald-trump-speech-cpac-february-29-2020/",
-    
-    # 2024
-    "https://rollcall.com/factbase/trump/transcript/donald-trump-speech-campaign-rally-new-york-madison-square-garden-october-27-2024/",
-    "https://rollcall.com/factbase/trump/transcript/donald-trump-speech-campaign-rally-reading-pennsylvania-november-4-2024/",
-    "https://rollcall.com/factbase/trump/transcript/donald-trump-speech-campaign-rally-allentown-pennsylvania-october-29-2024/",
-    "https://rollcall.com/factbase/trump/transcript/donald-trump-speech-political-rally-phoenix-december-22-2024/",
-    "https://rollcall.com/factbase/trump/transcript/donald-trump-speech-political-rally-charlotte-north-carolina-july-24-2024/",
-    "https://rollcall.com/factbase/trump/transcript/donald-trump-speech-political-rally-las-vegas-june-9-2024/",
-    
-    # 2025
-    "https://rollcall.com/factbase/trump/transcript/donald-trump-speech-political-rally-washington-january-19-2025/",
-    "https://rollcall.com/factbase/trump/transcript/donald-trump-speech-commencement-address-west-point-usma-may-24-2025/",
-    "https://rollcall.com/factbase/trump/transcript/donald-trump-press-conference-briefing-karoline-leavitt-january-28-2025/",
-    "https://rollcall.com/factbase/trump/transcript/donald-trump-press-conference-briefing-karoline-leavitt-january-31-2025/",
-    "https://rollcall.com/factbase/trump/transcript/donald-trump-press-conference-briefing-karoline-leavitt-february-12-2025/",
-    "https://rollcall.com/factbase/trump/transcript/donald-trump-press-conference-briefing-karoline-leavitt-march-5-2025/",
-    "https://rollcall.com/factbase/trump/transcript/donald-trump-press-conference-briefing-karoline-leavitt-april-28-2025/",
-    "https://rollcall.com/factbase/trump/transcript/donald-trump-press-briefing-karoline-leavitt-the-white-house-june-2-2025/",
-    "https://rollcall.com/factbase/trump/transcript/donald-trump-press-conference-briefing-karoline-leavitt-june-11-2025/",
-    "https://rollcall.com/factbase/trump/transcript/donald-trump-press-conference-briefing-karoline-leavitt-july-7-2025/",
-    "https://rollcall.com/factbase/trump/transcript/donald-trump-press-conference-briefing-karoline-leavitt-august-12-2025/",
-    "https://rollcall.com/factbase/trump/transcript/donald-trump-press-conference-briefing-karoline-leavitt-august-28-2025/",
-    "https://rollcall.com/factbase/trump/transcript/donald-trump-speech-jd-vance-economy-la-crosse-wisconsin-august-28-2025/",
-    "https://rollcall.com/factbase/trump/transcript/donald-trump-interview-jd-vance-lara-trump-fox-news-september-6-2025/",
-    "https://rollcall.com/factbase/trump/transcript/donald-trump-remarks-jd-vance-charlie-kirk-podcast-guest-host-september-15-2025/",
-    "https://rollcall.com/factbase/trump/transcript/donald-trump-remarks-jd-vance-tax-spending-cuts-howell-michigan-september-17-2025/",
-    "https://rollcall.com/factbase/trump/transcript/donald-trump-remarks-jd-vance-charlie-kirk-memorial-glendale-arizona-september-21-2025/",
-    "https://rollcall.com/factbase/trump/transcript/donald-trump-speech-80th-united-nations-general-assembly-september-23-2025/",
-    "https://rollcall.com/factbase/trump/transcript/donald-trump-speech-department-of-defense-leaders-quantico-september-30-2025/",
-    "https://rollcall.com/factbase/trump/transcript/donald-trump-remarks-space-force-relocation-alabama-september-2-2025/",
-    "https://rollcall.com/factbase/trump/transcript/donald-trump-interview-jd-vance-bartiromo-fox-sunday-morning-futures-october-12-2025/",
-    "https://rollcall.com/factbase/trump/transcript/donald-trump-remarks-jd-vance-anniversary-usmc-california-october-18-2025/",
-    "https://rollcall.com/factbase/trump/transcript/donald-trump-remarks-jd-vance-turning-point-usa-oxford-mississippi-october-30-2025/",
-    "https://rollcall.com/factbase/trump/transcript/donald-trump-remarks-jd-vance-usmc-ball-november-8-2025/",
-    "https://rollcall.com/factbase/trump/transcript/donald-trump-remarks-bilat-mohammed-bin-salman-saudi-arabia-november-18-2025/",
-    "https://rollcall.com/factbase/trump/transcript/donald-trump-remarks-jd-vance-thanksgiving-troops-kentucky-november-26-2025/",
-]
-
-
 if __name__ == '__main__':
     # First, save known URLs
-    OUTPUT_FILE.parent.mkdir(parents=True, exist_ok=True)
-    
-    print(f"Saving {len(KNOWN_URLS)} known URLs...")
-    with open(OUTPUT_FILE, 'w') as f:
-        json.dump({
-            'discovered_at': datetime.now().isoformat(),
-            'total_count': len(KNOWN_URLS),
-            'urls': sorted(list(set(KNOWN_URLS)))
-        }, f, indent=2)
+    known_urls = load_known_urls()
+    print(f"Saving {len(known_urls)} known URLs...")
+    save_url_file(known_urls)
     
     print(f"Saved to {OUTPUT_FILE}")
     print()
     print("To discover more URLs automatically, uncomment and run main()")
-    print("Or manually add URLs to the KNOWN_URLS list")
+    print(f"Or manually add URLs to {KNOWN_URLS_FILE}")
     print()
     print("To import all transcripts, run:")
     print("  python3 import_all.py")
@@ -1,31 +1,116 @@
 import requests
-from bs4 import BeautifulSoup
-import time
+from selectolax.parser import HTMLParser
 import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from database import Database
-from text_analysis import analyze_word_frequency, count_words
+from http_utils import ACCEPT_ENCODING, Throttle, http_retry, mount_pool
+from text_analysis import analyze_text
+
+# Optional on-disk HTTP cache so reruns don't refetch unchanged pages
+try:
+    from requests_cache import CachedSession
+    HAS_REQUESTS_CACHE = True
+except ImportError:
+    HAS_REQUESTS_CACHE = False
+
+# Link selectors for the link-discovery pages (href substring match runs in the parser)
+TRANSCRIPT_LINK_SELECTOR = 'a[href*="transcript"]'
+SPEECH_LINK_SELECTOR = 'a[href*="/speech/"]'
+DOCS_LINK_SELECTOR = 'a[href*="/documents/"]'
+
+# Case-insensitive "trump" match for link titles and hrefs
+TRUMP_RE = re.compile(r'trump', re.IGNORECASE)
+
+# Keep-alive connections kept per host (requests defaults to 10)
+POOL_MAXSIZE = 16
+
+# Up to 5 retries (0.5s, 1s, 2s, ...) - the archive/search sources flake often
+HTTP_RETRY = http_retry(total=5)
+
+# Scraped transcripts written per transaction (one commit each)
+COMMIT_BATCH_SIZE = 10
+
+# Cached responses (only 200s) are reused for a day
+HTTP_CACHE_PATH = './data/http_cache.sqlite'
+HTTP_CACHE_EXPIRE_SECONDS = 24 * 60 * 60
+
+# Per-source page layout: content CSS selectors in fallback order, the date
+# element, and the attribute holding the date (text is used otherwise).
+# Sources not listed here fall back to the generic whole-body scrape.
+SOURCE_CONFIG = {
+    'miller_center': {
+        'content': ['div.view-transcript'],
+        'date': 'span.date-display-single',
+    },
+    'presidency_project': {
+        'content': ['div.field-docs-content', 'div.field-items'],
+        'date': 'span.date-display-single',
+    },
+    'rev': {
+        'content': ['div.fl-callout-text', 'div.post-content'],
+        'date': 'time',
+        'date_attr': 'datetime',
+    },
+}
 
 class FactBaseScraper2:
     """
     Alternative scraper that tries different FactBase URLs and structures
     """
-    def __init__(self):
-        self.session = requests.Session()
+    def __init__(self, max_workers=8):
+        self.max_workers = max_workers
+        if HAS_REQUESTS_CACHE:
+            self.session = CachedSession(HTTP_CACHE_PATH, backend='sqlite', expire_after=HTTP_CACHE_EXPIRE_SECONDS,
+                                         allowable_methods=('GET',), allowable_codes=(200,))
+        else:
+            self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+            'Accept-Language': 'en-US,en;q=0.9',
+            'Accept-Encoding': ACCEPT_ENCODING,
         })
+        mount_pool(self.session, pool_maxsize=POOL_MAXSIZE, max_retries=HTTP_RETRY)
         self.db = Database()
         self.delay = 2
+        # Request starts delay/max_workers seconds apart across all workers
+        self.throttle = Throttle(self.delay / self.max_workers)
+
+    def save_batch(self, batch):
+        """
+        Write (url, content, word_count, word_freqs) rows in one transaction.
+        Returns the number of new transcripts saved.
+        """
+        saved = []
+        with self.db.transaction():
+            for url, content, word_count, word_freqs in batch:
+                transcript_id = self.db.insert_transcript(
+                    title=content['title'],
+                    date=content.get('date') or '',
+                    speech_type=content.get('speech_type', 'Speech'),
+                    location=content.get('location') or '',
+                    url=url,
+                    full_text=content['full_text'],
+                    word_count=word_count
+                )
+                if transcript_id:
+                    self.db.buffer_word_frequencies(transcript_id, word_freqs)
+                    saved.append(transcript_id)
+            self.db.flush_word_freqs()
+
+        # Only reported once committed
+        for transcript_id in saved:
+            print(f"  ✓ Saved (ID: {transcript_id})")
+        return len(saved)
 
     def fetch_page(self, url):
-        """Fetch a page"""
+        """Fetch and parse a page (safe to call from worker threads)"""
         print(f"Fetching: {url}")
         try:
+            self.throttle.wait()
             response = self.session.get(url, timeout=30)
             response.raise_for_status()
-            time.sleep(self.delay)
-            return BeautifulSoup(response.content, 'lxml')
+            return HTMLParser(response.content)
         except Exception as e:
             print(f"Error: {e}")
             return None
@@ -42,10 +127,10 @@ class FactBaseScraper2:
 
         for url in urls:
             print(f"\nTrying Archive.org: {url}")
-            soup = self.fetch_page(url)
-            if soup:
+            tree = self.fetch_page(url)
+            if tree:
                 # Look for transcript links
-                links = soup.find_all('a', href=re.compile(r'transcript'))
+                links = tree.css(TRANSCRIPT_LINK_SELECTOR)
                 print(f"Found {len(links)} potential transcript links")
                 return links
         return []
@@ -58,22 +143,22 @@ class FactBaseScraper2:
         search_url = f"{base_url}/the-presidency/presidential-speeches"
 
         print(f"\nTrying Miller Center: {search_url}")
-        soup = self.fetch_page(search_url)
+        tree = self.fetch_page(search_url)
 
-        if not soup:
+        if not tree:
             return []
 
         transcripts = []
         # Find all speech links
-        speech_links = soup.find_all('a', href=re.compile(r'/speech/'))
+        speech_links = tree.css(SPEECH_LINK_SELECTOR)
 
         for link in speech_links:
-            href = link.get('href', '')
+            href = link.attributes.get('href') or ''
             if not href.startswith('http'):
                 href = base_url + href
 
-            title = link.get_text(strip=True)
-            if 'Trump' in title or 'trump' in href.lower():
+            title = link.text(strip=True)
+            if TRUMP_RE.search(title) or TRUMP_RE.search(href):
                 transcripts.append({
                     'url': href,
                     'title': title,
@@ -98,20 +183,20 @@ class FactBaseScraper2:
 
         for url in urls:
             print(f"\nTrying American Presidency Project: {url}")
-            soup = self.fetch_page(url)
+            tree = self.fetch_page(url)
 
-            if not soup:
+            if not tree:
                 continue
 
             # Find document links
-            doc_links = soup.find_all('a', href=re.compile(r'/documents/'))
+            doc_links = tree.css(DOCS_LINK_SELECTOR)
 
             for link in doc_links[:50]:  # Limit for now
-                href = link.get('href', '')
+                href = link.attributes.get('href') or ''
                 if not href.startswith('http'):
                     href = base_url + href
 
-                title = link.get_text(strip=True)
+                title = link.text(strip=True)
                 if title:
                     all_transcripts.append({
                         'url': href,
@@ -129,21 +214,21 @@ class FactBaseScraper2:
         search_url = "https://www.rev.com/blog/transcript-category/donald-trump-transcripts"
 
         print(f"\nTrying Rev.com: {search_url}")
-        soup = self.fetch_page(search_url)
+        tree = self.fetch_page(search_url)
 
-        if not soup:
+        if not tree:
             return []
 
         transcripts = []
         # Find all article links
-        articles = soup.find_all('article')
+        articles = tree.css('article')
 
         for article in articles:
-            link = article.find('a', href=True)
+            link = article.css_first('a[href]')
             if link:
-                href = link.get('href', '')
-                title_elem = article.find(['h2', 'h3'])
-                title = title_elem.get_text(strip=True) if title_elem else link.get_text(strip=True)
+                href = link.attributes.get('href') or ''
+                title_elem = article.css_first('h2, h3')
+                title = title_elem.text(strip=True) if title_elem else link.text(strip=True)
 
                 if title:
                     transcripts.append({
@@ -157,66 +242,34 @@ class FactBaseScraper2:
 
     def scrape_transcript_content(self, url, source):
         """Scrape content based on source"""
-        soup = self.fetch_page(url)
-        if not soup:
+        tree = self.fetch_page(url)
+        if not tree:
             return None
 
         full_text = None
-        title = None
         date = None
         speech_type = 'Speech'
 
-        if source == 'miller_center':
-            # Miller Center specific selectors
-            content_div = soup.find('div', class_='view-transcript')
-            if content_div:
-                full_text = content_div.get_text(strip=True, separator=' ')
-
-            title_elem = soup.find('h1')
-            title = title_elem.get_text(strip=True) if title_elem else 'Unknown'
-
-            date_elem = soup.find('span', class_='date-display-single')
-            if date_elem:
-                date = date_elem.get_text(strip=True)
-
-        elif source == 'presidency_project':
-            # American Presidency Project selectors
-            content_div = soup.find('div', class_='field-docs-content')
-            if not content_div:
-                content_div = soup.find('div', class_='field-items')
-
-            if content_div:
-                full_text = content_div.get_text(strip=True, separator=' ')
-
-            title_elem = soup.find('h1')
-            title = title_elem.get_text(strip=True) if title_elem else 'Unknown'
-
-            date_elem = soup.find('span', class_='date-display-single')
-            if date_elem:
-                date = date_elem.get_text(strip=True)
-
-        elif source == 'rev':
-            # Rev.com selectors
-            content_div = soup.find('div', class_='fl-callout-text')
-            if not content_div:
-                content_div = soup.find('div', class_='post-content')
+        title_elem = tree.css_first('h1')
+        title = title_elem.text(strip=True) if title_elem else 'Unknown'
 
+        config = SOURCE_CONFIG.get(source)
+        if config:
+            # First content selector that matches wins
+            content_div = next(filter(None, (tree.css_first(sel) for sel in config['content'])), None)
             if content_div:
-                full_text = content_div.get_text(strip=True, separator=' ')
+                full_text = content_div.text(separator=' ', strip=True)
 
-            title_elem = soup.find('h1')
-            title = title_elem.get_text(strip=True) if title_elem else 'Unknown'
-
-            date_elem = soup.find('time')
+            date_elem = tree.css_first(config['date'])
             if date_elem:
-                date = date_elem.get('datetime', date_elem.get_text(strip=True))
-
+                date_attr = config.get('date_attr')
+                date = (date_attr and date_elem.attributes.get(date_attr)) or date_elem.text(strip=True)
         else:
-            # Generic scraping
-            paragraphs = soup.find_all('p')
-            full_text = ' '.join([p.get_text(strip=True) for p in paragraphs])
-            title_elem = soup.find('h1')
-            title = title_elem.get_text(strip=True) if title_elem else 'Unknown'
+            # Generic scraping - one text walk over the page body; unlike
+            # BeautifulSoup, selectolax would include script/style contents
+            tree.strip_tags(['script', 'style', 'noscript'])
+            body = tree.body or tree.root
+            full_text = body.text(separator=' ', strip=True)
 
         if not full_text or len(full_text) < 200:
             return None
@@ -239,15 +292,17 @@ class FactBaseScraper2:
 
         all_transcripts = []
 
-        # Try different sources
-        print("\n1. Trying Miller Center...")
-        all_transcripts.extend(self.scrape_miller_center())
-
-        print("\n2. Trying American Presidency Project...")
-        all_transcripts.extend(self.scrape_american_presidency_project())
-
-        print("\n3. Trying Rev.com...")
-        all_transcripts.extend(self.scrape_rev_transcripts())
+        # Try different sources - they're independent, so query them concurrently
+        sources = [
+            self.scrape_miller_center,
+            self.scrape_american_presidency_project,
+            self.scrape_rev_transcripts,
+        ]
+        print("\nTrying Miller Center, American Presidency Project and Rev.com...")
+        with ThreadPoolExecutor(max_workers=len(sources)) as pool:
+            # Results come back in source order
+            for found in pool.map(lambda scrape: scrape(), sources):
+                all_transcripts.extend(found)
 
         print(f"\n{'='*80}")
         print(f"Total transcripts found: {len(all_transcripts)}")
@@ -262,38 +317,40 @@ class FactBaseScraper2:
         success_count = 0
         limit = min(50, len(all_transcripts))  # Process up to 50 transcripts
 
-        for i, transcript in enumerate(all_transcripts[:limit], 1):
-            print(f"\n[{i}/{limit}] {transcript['title'][:60]}...")
+        # Check which transcripts are already stored (one batched query)
+        candidates = all_transcripts[:limit]
+        existing = self.db.existing_urls(t['url'] for t in candidates)
+        pending = [t for t in candidates if t['url'] not in existing]
+        print(f"Already in database: {len(candidates) - len(pending)} | To scrape: {len(pending)}")
+
+        # Fetch and parse in worker threads; results come back in order and
+        # all database writes stay on this thread (sqlite connections aren't shared).
+        # Parsed transcripts are written COMMIT_BATCH_SIZE per transaction, so no
+        # transaction is held open across network I/O
+        batch = []
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            results = pool.map(
+                lambda t: self.scrape_transcript_content(t['url'], t.get('source', 'generic')),
+                pending
+            )
 
-            if self.db.url_exists(transcript['url']):
-                print("  Already in database")
-                continue
+            for i, (transcript, content) in enumerate(zip(pending, results), 1):
+                print(f"\n[{i}/{len(pending)}] {transcript['title'][:60]}...")
 
-            content = self.scrape_transcript_content(transcript['url'], transcript.get('source', 'generic'))
+                if not content or not content.get('full_text'):
+                    print("  Failed to extract content")
+                    continue
 
-            if not content or not content.get('full_text'):
-                print("  Failed to extract content")
-                continue
+                # Word count and frequencies from one tokenization pass
+                word_count, word_freqs = analyze_text(content['full_text'])
+                print(f"  Words: {word_count}")
 
-            word_count = count_words(content['full_text'])
-            print(f"  Words: {word_count}")
-
-            # Save to database
-            transcript_id = self.db.insert_transcript(
-                title=content['title'],
-                date=content.get('date') or '',
-                speech_type=content.get('speech_type', 'Speech'),
-                location=content.get('location') or '',
-                url=transcript['url'],
-                full_text=content['full_text'],
-                word_count=word_count
-            )
+                batch.append((transcript['url'], content, word_count, word_freqs))
+                if len(batch) >= COMMIT_BATCH_SIZE:
+                    success_count += self.save_batch(batch)
+                    batch = []
 
-            if transcript_id:
-                word_freqs = analyze_word_frequency(content['full_text'])
-                self.db.insert_word_frequencies(transcript_id, word_freqs)
-                print(f"  ✓ Saved (ID: {transcript_id})")
-                success_count += 1
+        success_count += self.save_batch(batch)
 
         print(f"\n{'='*80}")
         print(f"COMPLETE - Saved {success_count} transcripts")
@@ -10,6 +10,9 @@ Usage:
     # Fix all missing transcripts:
     python3 fix_missing_transcripts.py --all
     
+    # Fix all missing transcripts with 4 browsers in parallel:
+    python3 fix_missing_transcripts.py --all --workers 4
+    
     # Fix specific transcript by URL:
     python3 fix_missing_transcripts.py --url "https://rollcall.com/..."
 """
@@ -19,17 +22,76 @@ import sys
 import argparse
 import time
 import re
+import json
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
 from typing import List, Dict, Optional, Tuple
+from urllib.parse import urlparse
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import TimeoutException, StaleElementReferenceException
+
+from http_utils import Throttle
+
+# Optional: plain-HTTP fast path for pages that render without JavaScript
+try:
+    import requests
+    from bs4 import BeautifulSoup
+    HAS_STATIC_FETCH = True
+except ImportError:
+    HAS_STATIC_FETCH = False
 
 DB_PATH = 'data/transcripts.db'
 
+# Rows that still need scraping; the partial index below is built on the same
+# predicate so SQLite can answer get_missing_transcripts without a table scan
+MISSING_TRANSCRIPT_WHERE = "word_count = 0 OR full_dialogue = '' OR full_dialogue IS NULL"
+
+# Last transcript-specific selector that worked, per site; tried first on later
+# pages (generic fallbacks like body/main are never cached)
+SELECTOR_CACHE_PATH = 'data/selector_cache.json'
+
+USER_AGENT = 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
+
+# Scraped transcripts written per transaction with --all
+UPDATE_BATCH_SIZE = 50
+
+# Seconds between page loads to the site; shared by all browsers with --all
+PAGE_LOAD_DELAY = 2
+
+# Browser tabs per driver: the one being scraped plus one preloading the next URL
+TAB_POOL_SIZE = 2
+
+# In-browser helpers, so a page check costs one ChromeDriver round trip
+# instead of one per element:
+# true once any selector in arguments[0] has over 200 chars of untrimmed innerText (page ready)
+READY_JS = '''
+return arguments[0].some(s => {
+    const el = document.querySelector(s);
+    return el !== null && el.innerText.length > 200;
+});
+'''
+# index and trimmed innerText of the first selector (from arguments[1] on) with
+# at least 200 chars, or null (Strategy 1's rule)
+FIRST_CONTENT_JS = '''
+const selectors = arguments[0];
+for (let i = arguments[1]; i < selectors.length; i++) {
+    const el = document.querySelector(selectors[i]);
+    if (el) {
+        const text = el.innerText.trim();
+        if (text.length >= 200) return [i, text];
+    }
+}
+return null;
+'''
+# innerText of every element matching arguments[0]
+ALL_TEXTS_JS = 'return Array.from(document.querySelectorAll(arguments[0]), e => e.innerText);'
+
 class Colors:
     """ANSI color codes"""
     GREEN = '\033[92m'
@@ -39,6 +101,23 @@ class Colors:
     BOLD = '\033[1m'
     END = '\033[0m'
 
+def load_selector_cache() -> Dict[str, str]:
+    """Read the per-site winning selectors saved by earlier runs (transcript-specific ones only)"""
+    try:
+        with open(SELECTOR_CACHE_PATH) as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return {site: selector for site, selector in cached.items()
+            if selector in TranscriptFixer.READY_SELECTORS}
+
+def save_selector_cache(selector_hits: Dict[str, str]):
+    """Persist the per-site winning selectors (written atomically)"""
+    tmp = SELECTOR_CACHE_PATH + '.tmp'
+    with open(tmp, 'w') as f:
+        json.dump(selector_hits, f, indent=2, sort_keys=True)
+    os.replace(tmp, SELECTOR_CACHE_PATH)
+
 def print_header(text: str):
     print(f"\n{Colors.BOLD}{Colors.BLUE}{'='*80}{Colors.END}")
     print(f"{Colors.BOLD}{Colors.BLUE}{text}{Colors.END}")
@@ -76,9 +155,22 @@ class TranscriptFixer:
         "body"  # Last resort
     ]
     
-    def __init__(self, headless: bool = True):
+    # Transcript-specific selectors; once one of these has rendered text the
+    # page is ready and scraping can start without a fixed sleep
+    READY_SELECTORS = CONTENT_SELECTORS[:6]
+    
+    def __init__(self, headless: bool = True, selector_hits: Optional[Dict[str, str]] = None,
+                 throttle: Optional[Throttle] = None):
         self.driver = None
         self.headless = headless
+        self.session = None
+        # Site -> content selector that last worked there (may be shared between fixers)
+        self.selector_hits = selector_hits if selector_hits is not None else {}
+        # Spaces page loads across every fixer sharing it (None = no pacing)
+        self.throttle = throttle
+        # Warm tabs, and the URL -> tab of pages already loading in one
+        self.tab_handles = []
+        self.preloaded = {}
         
     def init_driver(self):
         """Initialize Selenium WebDriver"""
@@ -88,10 +180,21 @@ class TranscriptFixer:
         options.add_argument('--no-sandbox')
         options.add_argument('--disable-dev-shm-usage')
         options.add_argument('--disable-gpu')
-        options.add_argument('user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36')
+        options.add_argument(f'user-agent={USER_AGENT}')
+        # Transcripts are text-only: return from get() at DOMContentLoaded and
+        # never download images/media
+        options.page_load_strategy = 'eager'
+        options.add_argument('--blink-settings=imagesEnabled=false')
+        options.add_argument('--disable-extensions')
+        options.add_experimental_option('prefs', {
+            'profile.managed_default_content_settings.images': 2,
+            'profile.default_content_setting_values.media_stream': 2,
+        })
         
         try:
             self.driver = webdriver.Chrome(options=options)
+            self.tab_handles = [self.driver.current_window_handle]
+            self.preloaded = {}
             print_success("WebDriver initialized")
             return True
         except Exception as e:
@@ -103,27 +206,92 @@ class TranscriptFixer:
         if self.driver:
             self.driver.quit()
             self.driver = None
+            self.tab_handles = []
+            self.preloaded = {}
+    
+    def _wait_turn(self, url: str):
+        """Wait for the shared throttle before requesting url"""
+        if self.throttle:
+            self.throttle.wait(url)
     
-    def scrape_transcript(self, url: str, max_retries: int = 3) -> Optional[Dict]:
+    def _open_page(self, url: str):
+        """Show url in the browser, switching to its tab if it was preloaded"""
+        handle = self.preloaded.pop(url, None)
+        if handle:
+            self.driver.switch_to.window(handle)
+        else:
+            self._wait_turn(url)
+            self.driver.get(url)
+    
+    def _preload(self, url: str):
+        """Start loading url in a spare tab without waiting for it"""
+        current = self.driver.current_window_handle
+        busy = set(self.preloaded.values())
+        spare = next((h for h in self.tab_handles if h != current and h not in busy), None)
+        
+        if spare:
+            self.driver.switch_to.window(spare)
+        elif len(self.tab_handles) < TAB_POOL_SIZE:
+            self.driver.switch_to.new_window('tab')
+            spare = self.driver.current_window_handle
+            self.tab_handles.append(spare)
+        else:
+            return
+        
+        # Assigning location returns immediately; the page loads in the background
+        self._wait_turn(url)
+        self.driver.execute_script('window.location.href = arguments[0];', url)
+        self.preloaded[url] = spare
+        self.driver.switch_to.window(current)
+    
+    def scrape_transcript(self, url: str, max_retries: int = 3, next_url: Optional[str] = None) -> Optional[Dict]:
         """
         Scrape a single transcript with retry logic
         
+        If next_url is given and the browser is needed, it starts loading in a
+        spare tab while this page is parsed
+        
         Returns:
             Dict with 'full_dialogue' and 'word_count', or None if failed
         """
+        # Fast path: one plain HTTP request, no browser
+        result = self._scrape_static(url)
+        if result:
+            # Release a tab that was preloading this page
+            self.preloaded.pop(url, None)
+            print_success(f"Extracted {result['word_count']} words without a browser")
+            return result
+        
         for attempt in range(1, max_retries + 1):
             print(f"  Attempt {attempt}/{max_retries}...")
             
             try:
-                # Load page
-                self.driver.get(url)
+                # Load page (retries always reload)
+                if attempt == 1:
+                    self._open_page(url)
+                else:
+                    self._wait_turn(url)
+                    self.driver.get(url)
+                
+                # Wait until transcript text renders, up to 5s, 7s, 9s per attempt
+                max_wait = 3 + (attempt * 2)
+                try:
+                    WebDriverWait(self.driver, max_wait,
+                                  ignored_exceptions=(StaleElementReferenceException,)).until(self._content_rendered)
+                except TimeoutException:
+                    # No transcript-specific container - fall through to the broader selectors
+                    pass
                 
-                # Try different wait times
-                wait_time = 3 + (attempt * 2)  # 5s, 7s, 9s
-                time.sleep(wait_time)
+                # Pages on the same site likely need the browser too: start the
+                # next one loading while this one is parsed
+                if next_url and attempt == 1:
+                    try:
+                        self._preload(next_url)
+                    except Exception as e:
+                        print_warning(f"Could not preload next page: {e}")
                 
                 # Extract dialogue with multiple selector attempts
-                dialogue_sections = self._extract_dialogue_robust()
+                dialogue_sections = self._extract_dialogue_robust(url)
                 
                 if dialogue_sections and len(dialogue_sections) > 0:
                     # Build full dialogue text
@@ -154,7 +322,75 @@ class TranscriptFixer:
         print_error(f"Failed after {max_retries} attempts")
         return None
     
-    def _extract_dialogue_robust(self) -> List[Dict]:
+    def _scrape_static(self, url: str) -> Optional[Dict]:
+        """
+        Scrape a transcript from the raw HTML, without a browser
+        
+        Returns:
+            Same dict as scrape_transcript, or None if the page needs the browser
+        """
+        if not HAS_STATIC_FETCH:
+            return None
+        
+        try:
+            if self.session is None:
+                self.session = requests.Session()
+                self.session.headers['User-Agent'] = USER_AGENT
+            self._wait_turn(url)
+            response = self.session.get(url, timeout=30)
+            response.raise_for_status()
+        except Exception as e:
+            print_warning(f"Static fetch failed ({e}), using browser")
+            return None
+        
+        soup = BeautifulSoup(response.content, 'lxml')
+        
+        # Transcript-specific containers only: on a JavaScript-rendered page the
+        # served HTML is just the article/main/body shell, which must go to the
+        # browser rather than be saved as the transcript
+        for selector in self._selectors_for(url, self.READY_SELECTORS):
+            elem = soup.select_one(selector)
+            if not elem:
+                continue
+            
+            text = elem.get_text('\n', strip=True)
+            if len(text) < 200:
+                continue
+            
+            dialogue = self._parse_speaker_sections(text)
+            if dialogue:
+                full_dialogue = self._build_dialogue_text(dialogue)
+                word_count = len(full_dialogue.split())
+                # Too little text usually means a JavaScript-rendered page
+                if word_count >= 100:
+                    self._record_hit(url, selector)
+                    return {
+                        'full_dialogue': full_dialogue,
+                        'word_count': word_count
+                    }
+                return None
+        
+        return None
+    
+    def _content_rendered(self, driver) -> bool:
+        """WebDriverWait condition: a transcript container holds substantial text"""
+        return bool(driver.execute_script(READY_JS, self.READY_SELECTORS))
+    
+    def _selectors_for(self, url: str, selectors: Optional[List[str]] = None) -> List[str]:
+        """selectors (default CONTENT_SELECTORS), with the one that last worked on this site first"""
+        if selectors is None:
+            selectors = self.CONTENT_SELECTORS
+        hit = self.selector_hits.get(urlparse(url).netloc)
+        if not hit or hit not in self.READY_SELECTORS:
+            return selectors
+        return [hit] + [selector for selector in selectors if selector != hit]
+    
+    def _record_hit(self, url: str, selector: str):
+        """Remember selector for url's site, unless it's a generic fallback (article, main, body...)"""
+        if selector in self.READY_SELECTORS:
+            self.selector_hits[urlparse(url).netloc] = selector
+    
+    def _extract_dialogue_robust(self, url: str) -> List[Dict]:
         """
         Extract dialogue using multiple strategies
         
@@ -163,32 +399,33 @@ class TranscriptFixer:
         """
         dialogue = []
         
-        # Strategy 1: Try each content selector
-        for selector in self.CONTENT_SELECTORS:
+        # Strategy 1: Try each content selector with substantial text, in order;
+        # the browser skips missing/short ones and resumes after a failed parse
+        selectors = self._selectors_for(url)
+        start = 0
+        while start < len(selectors):
             try:
-                elem = self.driver.find_element(By.CSS_SELECTOR, selector)
-                text = elem.text.strip()
-                
-                # Must have substantial text
-                if len(text) < 200:
-                    continue
-                
-                print(f"    Using selector: {selector}")
-                
-                # Try to parse speaker sections from text
-                dialogue = self._parse_speaker_sections(text)
-                
-                if dialogue and len(dialogue) > 0:
-                    return dialogue
-                    
-            except NoSuchElementException:
-                continue
-            except Exception as e:
-                continue
+                found = self.driver.execute_script(FIRST_CONTENT_JS, selectors, start)
+            except Exception:
+                break
+            if not found:
+                break
+            index, text = found
+            selector = selectors[index]
+            start = index + 1
+            
+            print(f"    Using selector: {selector}")
+            
+            # Try to parse speaker sections from text
+            dialogue = self._parse_speaker_sections(text)
+            
+            if dialogue and len(dialogue) > 0:
+                self._record_hit(url, selector)
+                return dialogue
         
         # Strategy 2: Look for paragraph elements with speaker patterns
         try:
-            paragraphs = self.driver.find_elements(By.TAG_NAME, 'p')
+            paragraphs = self.driver.execute_script(ALL_TEXTS_JS, 'p')
             dialogue = self._extract_from_paragraphs(paragraphs)
             if dialogue:
                 return dialogue
@@ -277,12 +514,12 @@ class TranscriptFixer:
         
         return dialogue
     
-    def _extract_from_paragraphs(self, paragraphs) -> List[Dict]:
-        """Extract dialogue from paragraph elements"""
+    def _extract_from_paragraphs(self, paragraphs: List[str]) -> List[Dict]:
+        """Extract dialogue from paragraph texts"""
         dialogue = []
         
         for p in paragraphs:
-            text = p.text.strip()
+            text = (p or '').strip()
             if not text or len(text) < 10:
                 continue
             
@@ -300,22 +537,16 @@ class TranscriptFixer:
     
     def _build_dialogue_text(self, sections: List[Dict]) -> str:
         """Build full dialogue text from sections"""
-        lines = []
-        
-        for section in sections:
-            speaker = section.get('speaker', 'Unknown')
-            text = section.get('text', '')
-            timestamp = section.get('timestamp', '')
-            
-            if timestamp:
-                lines.append(f"{speaker} ({timestamp})")
-            else:
-                lines.append(speaker)
-            
-            lines.append(text)
-            lines.append('')  # Blank line between sections
+        def lines():
+            for section in sections:
+                speaker = section.get('speaker', 'Unknown')
+                timestamp = section.get('timestamp', '')
+                
+                yield f"{speaker} ({timestamp})" if timestamp else speaker
+                yield section.get('text', '')
+                yield ''  # Blank line between sections
         
-        return '\n'.join(lines)
+        return '\n'.join(lines())
 
 def get_missing_transcripts(conn: sqlite3.Connection) -> List[Tuple[int, str, str, str]]:
     """
@@ -325,23 +556,33 @@ def get_missing_transcripts(conn: sqlite3.Connection) -> List[Tuple[int, str, st
         List of (id, url, title, date) tuples
     """
     cursor = conn.cursor()
-    cursor.execute("""
+    cursor.execute(f"""
         SELECT id, url, title, date
         FROM transcripts
-        WHERE word_count = 0 OR full_dialogue = '' OR full_dialogue IS NULL
+        WHERE {MISSING_TRANSCRIPT_WHERE}
         ORDER BY date DESC
     """)
     return cursor.fetchall()
 
-def update_transcript(conn: sqlite3.Connection, transcript_id: int, full_dialogue: str, word_count: int):
-    """Update transcript in database"""
-    cursor = conn.cursor()
-    cursor.execute("""
-        UPDATE transcripts
-        SET full_dialogue = ?, word_count = ?
-        WHERE id = ?
-    """, (full_dialogue, word_count, transcript_id))
-    conn.commit()
+def ensure_missing_index(conn: sqlite3.Connection):
+    """Create the partial index over not-yet-scraped rows (no-op if it exists)"""
+    with conn:
+        conn.execute(f"""
+            CREATE INDEX IF NOT EXISTS idx_missing_transcripts
+            ON transcripts(date DESC)
+            WHERE {MISSING_TRANSCRIPT_WHERE}
+        """)
+
+def update_transcripts(conn: sqlite3.Connection, updates: List[Tuple[str, int, int]]):
+    """Update transcripts in one transaction; updates are (full_dialogue, word_count, id) rows"""
+    if not updates:
+        return
+    with conn:
+        conn.executemany("""
+            UPDATE transcripts
+            SET full_dialogue = ?, word_count = ?
+            WHERE id = ?
+        """, updates)
 
 def fix_single_transcript(fixer: TranscriptFixer, conn: sqlite3.Connection, 
                          transcript_id: int, url: str, title: str) -> bool:
@@ -358,22 +599,67 @@ def fix_single_transcript(fixer: TranscriptFixer, conn: sqlite3.Connection,
     result = fixer.scrape_transcript(url)
     
     if result:
-        update_transcript(conn, transcript_id, result['full_dialogue'], result['word_count'])
+        update_transcripts(conn, [(result['full_dialogue'], result['word_count'], transcript_id)])
         print_success(f"Updated database: {result['word_count']} words")
         return True
     else:
         print_error("Failed to scrape transcript")
         return False
 
+def scrape_all(fixers: List[TranscriptFixer], missing: List[Tuple[int, str, str, str]],
+               stop: threading.Event):
+    """
+    Scrape transcripts across a pool of browsers (one per fixer)
+    
+    Browser k takes rows k, k+N, k+2N, ... so it knows its next URL and can
+    preload it in a spare tab. Once stop is set, workers finish (or fail) the
+    page in hand and take no more; closing the generator sets stop itself
+    
+    Yields:
+        scrape_transcript results, in the same order as missing
+    """
+    futures = [Future() for _ in missing]
+    stride = len(fixers)
+    
+    def work(first: int, fixer: TranscriptFixer):
+        for i in range(first, len(missing), stride):
+            if stop.is_set():
+                return
+            if not futures[i].set_running_or_notify_cancel():
+                continue
+            transcript_id, url, title, date = missing[i]
+            next_url = missing[i + stride][1] if i + stride < len(missing) else None
+            print(f"\n  Scraping ID {transcript_id}: {title[:60]}...")
+            try:
+                futures[i].set_result(fixer.scrape_transcript(url, next_url=next_url))
+            except Exception as e:
+                futures[i].set_exception(e)
+    
+    with ThreadPoolExecutor(max_workers=stride) as pool:
+        for first, fixer in enumerate(fixers):
+            pool.submit(work, first, fixer)
+        try:
+            for future in futures:
+                yield future.result()
+        finally:
+            # Ctrl+C / early exit: drop every row no worker has started
+            stop.set()
+            for future in futures:
+                future.cancel()
+
 def main():
     parser = argparse.ArgumentParser(description='Fix missing transcripts')
     parser.add_argument('--test-id', type=int, help='Test on single transcript ID')
     parser.add_argument('--url', help='Fix specific URL')
     parser.add_argument('--all', action='store_true', help='Fix all missing transcripts')
     parser.add_argument('--headless', action='store_true', default=True, help='Run browser in headless mode')
+    parser.add_argument('--workers', type=int, default=1, help='Browsers to run in parallel with --all')
     
     args = parser.parse_args()
     
+    if args.workers < 1:
+        parser.error('--workers must be at least 1')
+    
     if not any([args.test_id, args.url, args.all]):
         parser.print_help()
         sys.exit(1)
@@ -381,14 +667,25 @@ def main():
     # Connect to database
     try:
         conn = sqlite3.connect(DB_PATH)
+        # WAL + relaxed sync: one cheap fsync per transaction
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA synchronous=NORMAL')
+        ensure_missing_index(conn)
     except sqlite3.Error as e:
         print_error(f"Failed to connect to database: {e}")
         sys.exit(1)
     
-    # Initialize fixer
-    fixer = TranscriptFixer(headless=args.headless)
+    # Initialize fixer; all fixers share (and finally save) the selector cache
+    selector_hits = load_selector_cache()
+    fixer = TranscriptFixer(headless=args.headless, selector_hits=selector_hits)
     if not fixer.init_driver():
         sys.exit(1)
+    extra_fixers = []
+    # Set before the browsers are closed so --all workers stop taking rows
+    stop = threading.Event()
+    results = None
+    # Scraped (full_dialogue, word_count, id) rows not yet written
+    updates = []
     
     try:
         if args.test_id:
@@ -427,21 +724,39 @@ def main():
             
             print_header(f"Found {len(missing)} Missing Transcripts")
             
+            # One browser per worker; scraping runs in worker threads and
+            # database updates stay on this thread. Page loads from all of
+            # them share one PAGE_LOAD_DELAY / workers spacing
+            workers = min(args.workers, len(missing))
+            fixer.throttle = Throttle(PAGE_LOAD_DELAY / workers)
+            for _ in range(workers - 1):
+                extra = TranscriptFixer(headless=args.headless, selector_hits=selector_hits,
+                                        throttle=fixer.throttle)
+                if extra.init_driver():
+                    extra_fixers.append(extra)
+            
             success_count = 0
             failed = []
             
-            for i, (transcript_id, url, title, date) in enumerate(missing, 1):
-                print(f"\n[{i}/{len(missing)}] Processing ID {transcript_id}...")
-                print(f"  Date: {date}")
-                print(f"  Title: {title[:60]}...")
+            results = scrape_all([fixer] + extra_fixers, missing, stop)
+            for i, ((transcript_id, url, title, date), result) in enumerate(zip(missing, results), 1):
+                print(f"\n[{i}/{len(missing)}] ID {transcript_id} ({date}): {title[:60]}")
                 
-                if fix_single_transcript(fixer, conn, transcript_id, url, title):
+                if result:
+                    updates.append((result['full_dialogue'], result['word_count'], transcript_id))
+                    print_success(f"Scraped: {result['word_count']} words")
                     success_count += 1
                 else:
+                    print_error("Failed to scrape transcript")
                     failed.append((transcript_id, url, title))
                 
-                # Rate limiting
-                time.sleep(2)
+                if len(updates) >= UPDATE_BATCH_SIZE:
+                    update_transcripts(conn, updates)
+                    print_success(f"Updated database: {len(updates)} transcripts")
+                    updates = []
+            
+            update_transcripts(conn, updates)
+            updates = []
             
             # Summary
             print_header("SUMMARY")
@@ -458,8 +773,25 @@ def main():
             sys.exit(0 if len(failed) == 0 else 1)
     
     finally:
+        stop.set()
         fixer.close_driver()
+        for extra in extra_fixers:
+            extra.close_driver()
+        if results is not None:
+            # Cancels unstarted rows and waits for the workers to wind down
+            results.close()
+        # Keep what was already scraped if we stopped mid-batch (Ctrl+C, error)
+        if updates:
+            try:
+                update_transcripts(conn, updates)
+                print_success(f"Updated database: {len(updates)} transcripts")
+            except sqlite3.Error as e:
+                print_error(f"Could not save {len(updates)} scraped transcripts: {e}")
         conn.close()
+        try:
+            save_selector_cache(selector_hits)
+        except OSError as e:
+            print_warning(f"Could not save selector cache: {e}")
 
 if __name__ == '__main__':
     main()
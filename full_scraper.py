@@ -4,37 +4,110 @@ Complete scraper that gets ALL Trump transcripts from 2016-present
 Designed to be run on-demand to refresh and get new transcripts
 """
 import requests
-from bs4 import BeautifulSoup
-import time
+from selectolax.parser import HTMLParser
 import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from database import Database
-from text_analysis import analyze_word_frequency, count_words
+from comprehensive_scraper import iter_doc_links
+from http_utils import Throttle, http_retry, mount_pool
+from text_analysis import analyze_text
+
+# Optional on-disk HTTP cache so reruns don't refetch unchanged pages
+try:
+    from requests_cache import CachedSession
+    HAS_REQUESTS_CACHE = True
+except ImportError:
+    HAS_REQUESTS_CACHE = False
+
+# Cached responses (only 200s) are reused for a week unless the server's
+# Cache-Control says otherwise; after that they're revalidated with
+# If-None-Match/If-Modified-Since and a 304 reuses the stored body
+HTTP_CACHE_PATH = './data/http_cache.sqlite'
+HTTP_CACHE_EXPIRE_SECONDS = 7 * 24 * 60 * 60
+
+# Slower backoff (1.5s, 3s, 6s) for the presidency.ucsb.edu listings.
+# Client errors like 404 fail straight away
+HTTP_RETRY = http_retry(backoff_factor=1.5)
+
+# Saved documents per commit
+COMMIT_BATCH_SIZE = 50
+
+# Dates already in YYYY-MM-DD form
+ISO_DATE_RE = re.compile(r'\d{4}-\d{2}-\d{2}')
+
+# Formats tried by parse_date, in order
+DATE_FORMATS = (
+    '%B %d, %Y',  # January 1, 2016
+    '%b %d, %Y',  # Jan 1, 2016
+    '%Y-%m-%d',
+    '%m/%d/%Y',
+)
+
+# Listing links with these in the title are navigation/system pages
+SKIP_TITLE_TOKENS = ('guidebook', 'category', 'attributes')
+
+# Title keyword -> speech type, checked in priority order
+SPEECH_TYPE_KEYWORDS = (
+    ('tweet', 'Tweet Collection'),
+    ('twitter', 'Tweet Collection'),
+    ('press release', 'Press Release'),
+    ('remarks', 'Speech'),
+    ('address', 'Speech'),
+    ('speech', 'Speech'),
+    ('interview', 'Interview'),
+    ('statement', 'Statement'),
+    ('executive order', 'Executive Order'),
+    ('proclamation', 'Proclamation'),
+    ('memorandum', 'Memorandum'),
+    ('press briefing', 'Press Briefing'),
+    ('press gaggle', 'Press Briefing'),
+)
 
 class FullScraper:
-    def __init__(self):
-        self.session = requests.Session()
+    def __init__(self, max_workers=10):
+        self.max_workers = max_workers
+        if HAS_REQUESTS_CACHE:
+            self.session = CachedSession(HTTP_CACHE_PATH, backend='sqlite', expire_after=HTTP_CACHE_EXPIRE_SECONDS,
+                                         allowable_methods=('GET',), allowable_codes=(200,), cache_control=True)
+        else:
+            self.session = requests.Session()
+        # One pooled connection per worker thread; retries handled by the adapter
+        mount_pool(self.session, pool_maxsize=max_workers, max_retries=HTTP_RETRY)
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36',
         })
         self.db = Database()
         self.delay = 1.5  # Faster but still respectful
         self.base_url = "https://www.presidency.ucsb.edu"
+        # Request starts delay/max_workers seconds apart across all workers
+        self.throttle = Throttle(self.delay / self.max_workers)
+
+    def _get(self, url):
+        """GET a URL, only waiting on the throttle when it goes to the network"""
+        if HAS_REQUESTS_CACHE:
+            # Uncached (or expired) URLs come back as 504 without a request
+            response = self.session.get(url, timeout=30, only_if_cached=True)
+            if response.status_code != 504:
+                return response
+        self.throttle.wait()
+        return self.session.get(url, timeout=30)
+
+    def fetch_raw(self, url):
+        """Fetch a page's raw bytes (safe to call from worker threads)"""
+        # Transient errors were already retried with backoff by HTTP_RETRY
+        try:
+            response = self._get(url)
+            response.raise_for_status()
+            return response.content
+        except Exception as e:
+            print(f"  ✗ Failed to fetch {url}: {e}")
+            return None
 
-    def fetch_page(self, url, retries=3):
-        """Fetch with retries"""
-        for attempt in range(retries):
-            try:
-                response = self.session.get(url, timeout=30)
-                response.raise_for_status()
-                time.sleep(self.delay)
-                return BeautifulSoup(response.content, 'lxml')
-            except Exception as e:
-                if attempt == retries - 1:
-                    print(f"  ✗ Failed after {retries} attempts: {e}")
-                    return None
-                time.sleep(2)
-        return None
+    def fetch_page(self, url):
+        """Fetch and parse a page (safe to call from worker threads)"""
+        content = self.fetch_raw(url)
+        return HTMLParser(content) if content is not None else None
 
     def parse_date(self, date_text):
         """Parse date into YYYY-MM-DD format"""
@@ -42,18 +115,11 @@ class FullScraper:
             return None
 
         # Already in correct format
-        if re.match(r'\d{4}-\d{2}-\d{2}', date_text):
+        if ISO_DATE_RE.match(date_text):
             return date_text
 
         # Try to parse various formats
-        formats = [
-            '%B %d, %Y',  # January 1, 2016
-            '%b %d, %Y',  # Jan 1, 2016
-            '%Y-%m-%d',
-            '%m/%d/%Y',
-        ]
-
-        for fmt in formats:
+        for fmt in DATE_FORMATS:
             try:
                 dt = datetime.strptime(date_text.strip(), fmt)
                 return dt.strftime('%Y-%m-%d')
@@ -62,84 +128,92 @@ class FullScraper:
 
         return date_text
 
+    def listing_url(self, page):
+        """URL of one page of the Trump document listing"""
+        return f"{self.base_url}/advanced-search?field-keywords=&from%5Bdate%5D=01-01-2016&to%5Bdate%5D=12-31-2024&person2=200301&items_per_page=100&page={page}"
+
     def get_all_pages(self):
         """Get all document listing pages - NO LIMIT"""
         all_docs = []
+        seen_urls = set()
         page = 0
         consecutive_empty = 0
+        done = False
 
         print("\n🔍 Discovering all Trump documents...")
 
-        while True:
-            url = f"{self.base_url}/advanced-search?field-keywords=&from%5Bdate%5D=01-01-2016&to%5Bdate%5D=12-31-2024&person2=200301&items_per_page=100&page={page}"
-
-            if page % 10 == 0:
-                print(f"  Page {page + 1}... (Total: {len(all_docs)})")
-
-            soup = self.fetch_page(url)
-            if not soup:
-                consecutive_empty += 1
-                if consecutive_empty >= 3:
-                    break
-                continue
-
-            doc_links = soup.find_all('a', href=re.compile(r'/documents/'))
-            new_docs = []
-
-            for link in doc_links:
-                href = link.get('href', '')
-                if not href.startswith('http'):
-                    href = self.base_url + href
-
-                title = link.get_text(strip=True)
-
-                # Skip navigation/system pages
-                if any(x in title.lower() for x in ['guidebook', 'category', 'attributes']):
-                    continue
-
-                if title and href not in [d['url'] for d in all_docs]:
-                    new_docs.append({'url': href, 'title': title})
-
-            if not new_docs:
-                consecutive_empty += 1
-                if consecutive_empty >= 3:
-                    print(f"  No more documents found after page {page + 1}")
-                    break
-            else:
-                consecutive_empty = 0
-                all_docs.extend(new_docs)
-
-            page += 1
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            while not done:
+                # Speculatively fetch the next max_workers listing pages at once;
+                # they're still processed strictly in page order below
+                batch = range(page, page + self.max_workers)
+                pages = pool.map(self.fetch_raw, [self.listing_url(p) for p in batch])
+
+                for content in pages:
+                    if page % 10 == 0:
+                        print(f"  Page {page + 1}... (Total: {len(all_docs)})")
+
+                    page += 1
+
+                    if not content:
+                        # fetch_raw already retried this page
+                        consecutive_empty += 1
+                        if consecutive_empty >= 3:
+                            done = True
+                            break
+                        continue
+
+                    new_docs = []
+
+                    for href, title in iter_doc_links(content, self.base_url):
+                        # Skip navigation/system pages
+                        title_lower = title.lower()
+                        if any(token in title_lower for token in SKIP_TITLE_TOKENS):
+                            continue
+
+                        if title and href not in seen_urls:
+                            seen_urls.add(href)
+                            new_docs.append({'url': href, 'title': title})
+
+                    if not new_docs:
+                        consecutive_empty += 1
+                        if consecutive_empty >= 3:
+                            print(f"  No more documents found after page {page}")
+                            done = True
+                            break
+                    else:
+                        consecutive_empty = 0
+                        all_docs.extend(new_docs)
 
         return all_docs
 
     def scrape_document(self, url):
         """Extract content from a document page"""
-        soup = self.fetch_page(url)
-        if not soup:
+        tree = self.fetch_page(url)
+        if not tree:
             return None
 
         # Title
-        title_elem = soup.find('h1', class_='title') or soup.find('h1')
-        title = title_elem.get_text(strip=True) if title_elem else 'Unknown'
+        title_elem = tree.css_first('h1.title') or tree.css_first('h1')
+        title = title_elem.text(strip=True) if title_elem else 'Unknown'
 
         # Date
         date = None
-        date_elem = soup.find('span', class_='date-display-single')
+        date_elem = tree.css_first('span.date-display-single')
         if date_elem:
-            date = self.parse_date(date_elem.get_text(strip=True))
+            date = self.parse_date(date_elem.text(strip=True))
 
         # Content
-        content_div = soup.find('div', class_='field-docs-content')
+        content_div = tree.css_first('div.field-docs-content')
         if not content_div:
-            content_div = soup.find('div', class_='field-items')
+            content_div = tree.css_first('div.field-items')
 
         if content_div:
-            full_text = content_div.get_text(strip=True, separator=' ')
+            full_text = content_div.text(separator=' ', strip=True)
         else:
             # Fallback: get all paragraphs
-            paragraphs = soup.find_all('p')
-            full_text = ' '.join([p.get_text(strip=True) for p in paragraphs])
+            paragraphs = tree.css('p')
+            full_text = ' '.join([p.text(strip=True) for p in paragraphs])
 
         # Determine speech type
         speech_type = self.determine_type(title)
@@ -156,29 +230,12 @@ class FullScraper:
         }
 
     def determine_type(self, title):
-        """Determine document type from title"""
+        """Determine document type from title (first matching keyword wins)"""
         title_lower = title.lower()
-
-        if 'tweet' in title_lower or 'twitter' in title_lower:
-            return 'Tweet Collection'
-        elif 'press release' in title_lower:
-            return 'Press Release'
-        elif any(x in title_lower for x in ['remarks', 'address', 'speech']):
-            return 'Speech'
-        elif 'interview' in title_lower:
-            return 'Interview'
-        elif 'statement' in title_lower:
-            return 'Statement'
-        elif 'executive order' in title_lower:
-            return 'Executive Order'
-        elif 'proclamation' in title_lower:
-            return 'Proclamation'
-        elif 'memorandum' in title_lower:
-            return 'Memorandum'
-        elif 'press briefing' in title_lower or 'press gaggle' in title_lower:
-            return 'Press Briefing'
-        else:
-            return 'Document'
+        return next(
+            (label for keyword, label in SPEECH_TYPE_KEYWORDS if keyword in title_lower),
+            'Document'
+        )
 
     def run(self, skip_existing=True):
         """Main scraper - gets EVERYTHING"""
@@ -207,46 +264,57 @@ class FullScraper:
 
         print(f"\n🚀 Starting scrape...")
 
-        for i, doc in enumerate(all_docs, 1):
-            if i % 50 == 0 or i == 1:
-                print(f"\n[{i}/{len(all_docs)}] Progress: {success} saved, {skipped} skipped, {failed} failed")
+        # Check which documents are already stored (one batched query)
+        pending = all_docs
+        if skip_existing:
+            existing = self.db.existing_urls(doc['url'] for doc in all_docs)
+            pending = [doc for doc in all_docs if doc['url'] not in existing]
+            skipped = len(all_docs) - len(pending)
 
-            # Check if exists
-            if skip_existing and self.db.url_exists(doc['url']):
-                skipped += 1
-                continue
-
-            # Scrape
-            content = self.scrape_document(doc['url'])
+        # Fetch and parse in worker threads; results come back in order and
+        # all database writes stay on this thread (sqlite connections aren't shared)
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            results = pool.map(self.scrape_document, [doc['url'] for doc in pending])
 
-            if not content:
-                failed += 1
-                continue
+            for i, (doc, content) in enumerate(zip(pending, results), 1):
+                if i % 50 == 0 or i == 1:
+                    print(f"\n[{i}/{len(pending)}] Progress: {success} saved, {skipped} skipped, {failed} failed")
 
-            word_count = count_words(content['full_text'])
+                if not content:
+                    failed += 1
+                    continue
 
-            # Save
-            try:
-                transcript_id = self.db.insert_transcript(
-                    title=content['title'],
-                    date=content['date'],
-                    speech_type=content['speech_type'],
-                    location=content['location'],
-                    url=doc['url'],
-                    full_text=content['full_text'],
-                    word_count=word_count
-                )
-
-                if transcript_id:
-                    word_freqs = analyze_word_frequency(content['full_text'])
-                    self.db.insert_word_frequencies(transcript_id, word_freqs)
-                    success += 1
-
-                    if success % 10 == 0:
-                        print(f"  ✓ {success} documents saved...")
-            except Exception as e:
-                print(f"  ✗ Error saving: {e}")
-                failed += 1
+                # Word count and frequencies from one tokenization pass
+                word_count, word_freqs = analyze_text(content['full_text'])
+
+                # Save
+                try:
+                    transcript_id = self.db.insert_transcript(
+                        title=content['title'],
+                        date=content['date'],
+                        speech_type=content['speech_type'],
+                        location=content['location'],
+                        url=doc['url'],
+                        full_text=content['full_text'],
+                        word_count=word_count
+                    )
+
+                    if transcript_id:
+                        self.db.buffer_word_frequencies(transcript_id, word_freqs)
+                        success += 1
+
+                        if success % 10 == 0:
+                            print(f"  ✓ {success} documents saved...")
+                        # One commit (one fsync) per batch of documents
+                        if success % COMMIT_BATCH_SIZE == 0:
+                            self.db.flush_word_freqs()
+                            self.db.commit()
+                except Exception as e:
+                    print(f"  ✗ Error saving: {e}")
+                    failed += 1
+
+            self.db.flush_word_freqs()
+            self.db.commit()
 
         print(f"\n{'='*80}")
         print(f"✅ SCRAPING COMPLETE")
@@ -0,0 +1,58 @@
+"""
+Shared HTTP plumbing for the scrapers: compressed-response negotiation,
+retry policy, pooled sessions and a thread-safe request throttle
+"""
+import threading
+import time
+from urllib.parse import urlparse
+
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Optional: lets urllib3 decode brotli-encoded responses
+try:
+    import brotli  # noqa: F401
+    HAS_BROTLI = True
+except ImportError:
+    HAS_BROTLI = False
+
+# Accept-Encoding header value; br is only advertised when it can be decoded
+ACCEPT_ENCODING = 'gzip, deflate, br' if HAS_BROTLI else 'gzip, deflate'
+
+# Statuses worth retrying: rate limiting and transient server/gateway errors
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+
+def http_retry(total=3, backoff_factor=0.5, status_forcelist=RETRY_STATUSES):
+    """Retry policy for GETs: exponential backoff, honouring Retry-After on 429/503"""
+    return Retry(total=total, backoff_factor=backoff_factor, status_forcelist=list(status_forcelist),
+                 allowed_methods=frozenset(['GET']), respect_retry_after_header=True)
+
+
+def mount_pool(session, pool_maxsize=10, pool_connections=10, max_retries=None):
+    """Mount one keep-alive adapter for http:// and https:// on session; returns session"""
+    adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize,
+                          max_retries=max_retries if max_retries is not None else 0)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+class Throttle:
+    """
+    Spaces request starts at least `interval` seconds apart across all threads.
+    Passing a URL to wait() keeps a separate schedule per host.
+    """
+    def __init__(self, interval):
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._next_at = {}
+
+    def wait(self, url=None):
+        """Block until the next request slot (for url's host, if given) and claim it"""
+        host = urlparse(url).netloc if url else ''
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_at.get(host, 0.0))
+            self._next_at[host] = start + self.interval
+        time.sleep(start - now)
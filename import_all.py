@@ -12,8 +12,9 @@ import sys
 import os
 import json
 import re
-import time
 import hashlib
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
@@ -22,24 +23,123 @@ sys.path.insert(0, str(Path(__file__).parent / 'backend'))
 
 try:
     import requests
-    from bs4 import BeautifulSoup
+    import lxml.html
+    from http_utils import ACCEPT_ENCODING, Throttle, http_retry, mount_pool
 except ImportError:
     print("Missing dependencies. Run:")
-    print("  pip3 install requests beautifulsoup4 lxml")
+    print("  pip3 install requests lxml")
     sys.exit(1)
 
-from database import init_database, insert_transcript, get_database_stats
+# Optional: faster JSON for the URL list and progress files
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# Optional on-disk HTTP cache: re-runs revalidate pages instead of re-downloading them
+try:
+    from requests_cache import CachedSession
+    HAS_REQUESTS_CACHE = True
+except ImportError:
+    HAS_REQUESTS_CACHE = False
+
+from database import init_database, insert_transcript, insert_transcripts, get_database_stats, compress_html
 
 URLS_FILE = Path(__file__).parent / "data" / "all_transcript_urls.json"
 PROGRESS_FILE = Path(__file__).parent / "data" / "import_progress.json"
+# Append-only {"u": url, "s": status} lines written since the last snapshot
+PROGRESS_LOG_FILE = Path(__file__).parent / "data" / "import_progress.jsonl"
 DEBUG_DIR = Path(__file__).parent / "data" / "debug"
 
+# Cached transcript pages are always revalidated with If-None-Match /
+# If-Modified-Since; a 304 reuses the stored body. Unvalidated entries
+# are dropped after a week
+HTTP_CACHE_FILE = Path(__file__).parent / "data" / "http_cache.sqlite"
+HTTP_CACHE_EXPIRE_SECONDS = 7 * 24 * 60 * 60
+
 HEADERS = {
     'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
     'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
     'Accept-Language': 'en-US,en;q=0.5',
+    'Accept-Encoding': ACCEPT_ENCODING,
 }
 
+# Transcripts fetched and parsed in parallel; database writes stay on the main thread
+MAX_WORKERS = 8
+
+# Parsed transcripts written per database transaction
+INSERT_BATCH_SIZE = 50
+
+# Minimum spacing between request starts to the same host (4 requests/s)
+MIN_REQUEST_INTERVAL = 0.25
+
+# Retry rate limiting and gateway errors; a plain 500 fails straight away
+HTTP_RETRY = http_retry(status_forcelist=(429, 502, 503, 504))
+
+# Shared keep-alive session: connections (and TLS handshakes) are reused
+# across transcripts instead of opened per request
+if HAS_REQUESTS_CACHE:
+    SESSION = CachedSession(str(HTTP_CACHE_FILE), backend='sqlite', expire_after=HTTP_CACHE_EXPIRE_SECONDS,
+                            allowable_methods=('GET',), allowable_codes=(200,), always_revalidate=True)
+else:
+    SESSION = requests.Session()
+SESSION.headers.update(HEADERS)
+mount_pool(SESSION, pool_maxsize=32, pool_connections=16, max_retries=HTTP_RETRY)
+
+# Per-host request spacing shared by all worker threads
+THROTTLE = Throttle(MIN_REQUEST_INTERVAL)
+
+# Text inside these tags is left out of page text (as BeautifulSoup's get_text() does)
+SKIP_TEXT_TAGS = frozenset(['script', 'style', 'template'])
+
+# Whitespace-only text inside these tags is kept as-is instead of collapsed
+PRESERVE_WHITESPACE_TAGS = frozenset(['pre', 'textarea'])
+
+# Whitespace-only text made of these collapses to a single newline or space
+ASCII_SPACES = ' \n\t\x0c\r'
+
+# Method 1: "## Speaker\n00:00:00-00:00:27 (27 sec)\n<signal>\n<text>" blocks.
+# The text runs up to the next "## X" header or the end of the page; it is
+# consumed possessively a run of non-# characters at a time, rather than one
+# character per step of a lazy ([\s\S]*?)(?=##\s+[A-Z]|\Z)
+SEGMENT_RE = re.compile(
+    r'##\s+([^\n]+)\n(\d{2}:\d{2}:\d{2})-(\d{2}:\d{2}:\d{2})\s*\([^)]*\)\s*\n'
+    r'(?:No StressLens|No Signal[^\n]*|Weak[^\n]*|Medium[^\n]*|Strong[^\n]*)\n'
+    r'((?:[^#]++|#(?!#\s+[A-Z]))*+)'
+)
+# First metadata line of a segment block; the spoken text ends there
+METADATA_LINE_RE = re.compile(
+    r'^[^\S\n]*(?:Sentiment|Loughran|Harvard|Moderation|OpenAI|Readability|Flesch|Topics|Topic:'
+    r'|Gunning|Coleman|SMOG|Automated|Dale-Chall|VADER|Sprache)',
+    re.MULTILINE
+)
+# Whole (stripped) lines to drop from a segment block: scores ("0.25", "1.2E-05",
+# "42") and sentiment labels ("Somewhat Positive")
+SCORE_OR_SENTIMENT_RE = re.compile(r'[\d.E-]+|(?:Very |Somewhat |Slightly |Leans )?(?:Positive|Negative|Neutral)')
+# Method 2: paragraphs that are only a timestamp or a score
+TIMESTAMP_PREFIX_RE = re.compile(r'^\d{2}:\d{2}:\d{2}')
+DECIMAL_LINE_RE = re.compile(r'^[\d.]+$')
+# Method 3: "Speaker Name: text" lines. Same matches as
+#   \b(Donald Trump|Dasha Burns|Reporter|Press|Journalist|[A-Z][a-z]+ [A-Z][a-z]+):\s*([^\n]+)
+# but starting with a plain [A-Z] (word boundary checked by lookbehind) lets
+# re skip straight to capital letters instead of trying every position
+SPEAKER_COLON_RE = re.compile(
+    r'([A-Z](?<!\w[A-Z])(?:(?<=D)onald Trump|(?<=D)asha Burns|(?<=R)eporter|(?<=P)ress|(?<=J)ournalist'
+    r'|[a-z]+ [A-Z][a-z]+)):\s*([^\n]+)'
+)
+# Method 4: "00:00:00-00:00:27" ranges (captured, so re.split keeps them)
+TIMESTAMP_RANGE_RE = re.compile(r'(\d{2}:\d{2}:\d{2}-\d{2}:\d{2}:\d{2})')
+TIMESTAMP_RE = re.compile(r'\d{2}:\d{2}:\d{2}')
+CLOCK_RE = re.compile(r'\d{2}:\d{2}')
+# Title metadata: "... in Location - January 19, 2025"
+TITLE_DATE_RE = re.compile(r'-\s*(\w+\s+\d{1,2},?\s*\d{4})\s*$')
+TITLE_LOCATION_RE = re.compile(r'\s+(?:in|at)\s+([^-]+?)(?:\s+-|\s*$)', re.IGNORECASE)
+# Transcript slug at the end of a Factbase URL
+TRANSCRIPT_ID_RE = re.compile(r'/transcript/([^/]+)/?$')
+# "## Speaker" headers (debug output only)
+HASH_HEADER_RE = re.compile(r'##\s+[^\n]+')
+
 
 def load_urls():
     """Load URLs from the JSON file."""
@@ -50,8 +150,8 @@ def load_urls():
         print("  python3 scrape_browser.py")
         return []
     
-    with open(URLS_FILE) as f:
-        data = json.load(f)
+    raw = URLS_FILE.read_bytes()
+    data = orjson.loads(raw) if HAS_ORJSON else json.loads(raw)
     
     if "urls" in data:
         return data["urls"]
@@ -67,34 +167,128 @@ def load_urls():
 
 
 def load_progress():
-    """Load import progress."""
+    """Load the progress snapshot, then replay any log lines written after it."""
+    progress = {"completed": [], "failed": [], "no_segments": []}
+    loads = orjson.loads if HAS_ORJSON else json.loads
     if PROGRESS_FILE.exists():
-        with open(PROGRESS_FILE) as f:
-            return json.load(f)
-    return {"completed": [], "failed": [], "no_segments": []}
+        progress.update(loads(PROGRESS_FILE.read_bytes()))
+    if PROGRESS_LOG_FILE.exists():
+        with open(PROGRESS_LOG_FILE, "rb") as f:
+            for line in f:
+                try:
+                    entry = loads(line)
+                except ValueError:
+                    # Torn last line from a crash mid-write
+                    continue
+                progress.setdefault(entry["s"], []).append(entry["u"])
+    return progress
 
 
-def save_progress(progress):
-    """Save import progress."""
-    with open(PROGRESS_FILE, "w") as f:
-        json.dump(progress, f, indent=2)
+def open_progress_log():
+    """Open the progress log for appending, line-buffered so each entry hits disk."""
+    log = open(PROGRESS_LOG_FILE, "a", buffering=1)
+    # Start on a fresh line if the last run died mid-write
+    if log.tell() and PROGRESS_LOG_FILE.read_bytes()[-1:] != b"\n":
+        log.write("\n")
+    return log
+
 
+def log_progress(log, url, status):
+    """Record one URL's new status ("completed", "failed" or "no_segments")."""
+    log.write(json.dumps({"u": url, "s": status}) + "\n")
 
-def fetch_transcript(url):
-    """Fetch transcript HTML from URL."""
-    response = requests.get(url, headers=HEADERS, timeout=60)
+
+def save_progress(progress):
+    """Atomically write the progress snapshot and drop the log it supersedes."""
+    if HAS_ORJSON:
+        payload = orjson.dumps(progress, option=orjson.OPT_INDENT_2)
+    else:
+        payload = json.dumps(progress, indent=2).encode('utf-8')
+    
+    tmp = PROGRESS_FILE.with_suffix(".json.tmp")
+    tmp.write_bytes(payload)
+    os.replace(tmp, PROGRESS_FILE)
+    if PROGRESS_LOG_FILE.exists():
+        PROGRESS_LOG_FILE.unlink()
+
+
+def fetch_transcript(url, session=SESSION):
+    """Fetch transcript HTML from URL (safe to call from worker threads)."""
+    THROTTLE.wait(url)
+    response = session.get(url, timeout=60)
     response.raise_for_status()
-    return response.text
+    # Pages are UTF-8; without a declared charset .text would run chardet
+    # over the whole (decompressed) body first
+    return response.content.decode(response.encoding or 'utf-8', errors='replace')
 
 
-def parse_transcript_method1(soup, page_text, url):
+def _collapse_space(text, preserve):
+    """Collapse a whitespace-only text node the way BeautifulSoup does."""
+    if preserve or text.strip(ASCII_SPACES):
+        return text
+    return '\n' if '\n' in text else ' '
+
+
+def _collect_text(elem, parts, preserve=False):
+    """Append the text nodes under an lxml element to parts, in document order."""
+    tag = elem.tag
+    # Comments and processing instructions have no string tag
+    if not isinstance(tag, str) or tag in SKIP_TEXT_TAGS:
+        return
+    preserve = preserve or tag in PRESERVE_WHITESPACE_TAGS
+    
+    if elem.text:
+        parts.append(_collapse_space(elem.text, preserve))
+    for child in elem:
+        _collect_text(child, parts, preserve)
+        if child.tail:
+            parts.append(_collapse_space(child.tail, preserve))
+
+
+def get_text(elem, strip=False):
+    """
+    Text of an lxml element, matching BeautifulSoup's get_text()/get_text(strip=True):
+    whitespace-only runs collapse to one newline or space and script/style/comment
+    text is skipped, so the parse methods see the same page text as before.
+    """
+    parts = []
+    _collect_text(elem, parts)
+    if strip:
+        return ''.join(part.strip() for part in parts)
+    return ''.join(parts)
+
+
+def get_page_text(tree):
+    """
+    get_text() of a whole document, using lxml's C-level itertext() for the walk.
+    Clears script/style bodies in place first (nothing downstream reads them);
+    documents with pre/textarea/template fall back to the Python walk.
+    """
+    if next(tree.iter('pre', 'textarea', 'template'), None) is not None:
+        return get_text(tree)
+    
+    for elem in tree.iter('script', 'style'):
+        elem.text = None
+    return ''.join([
+        text if text.strip(ASCII_SPACES) else ('\n' if '\n' in text else ' ')
+        for text in tree.itertext()
+    ])
+
+
+def _next_element(elem):
+    """Next sibling element, skipping comments (like BeautifulSoup's find_next_sibling())."""
+    elem = elem.getnext()
+    while elem is not None and not isinstance(elem.tag, str):
+        elem = elem.getnext()
+    return elem
+
+
+def parse_transcript_method1(tree, page_text, url):
     """Method 1: Parse using ## Speaker pattern from plain text."""
     segments = []
     
     # Pattern: ## SpeakerName\n00:00:00-00:00:00 (X sec)\n<signal>\n<text>
-    segment_pattern = r'##\s+([^\n]+)\n(\d{2}:\d{2}:\d{2})-(\d{2}:\d{2}:\d{2})\s*\([^)]*\)\s*\n(?:No StressLens|No Signal[^\n]*|Weak[^\n]*|Medium[^\n]*|Strong[^\n]*)\n([\s\S]*?)(?=##\s+[A-Z]|\Z)'
-    
-    matches = re.findall(segment_pattern, page_text)
+    matches = SEGMENT_RE.findall(page_text)
     
     for match in matches:
         speaker = match[0].strip()
@@ -105,20 +299,15 @@ def parse_transcript_method1(soup, page_text, url):
         if speaker.lower() in ['note', 'topics', 'entities', 'moderation', 'speakers', 'stresslens', 'full transcript']:
             continue
         
-        text_lines = []
-        for line in text_block.split('\n'):
-            line = line.strip()
-            if not line:
-                continue
-            if line.startswith(('Sentiment', 'Loughran', 'Harvard', 'Moderation', 'OpenAI', 
-                               'Readability', 'Flesch', 'Topics', 'Topic:', 'Gunning',
-                               'Coleman', 'SMOG', 'Automated', 'Dale-Chall', 'VADER', 'Sprache')):
-                break
-            if re.match(r'^[\d.E-]+$', line) or re.match(r'^\d+(\.\d+)?$', line):
-                continue
-            if re.match(r'^(Very |Somewhat |Slightly |Leans )?(Positive|Negative|Neutral)$', line):
-                continue
-            text_lines.append(line)
+        # Everything from the first metadata line on is analysis, not speech
+        cutoff = METADATA_LINE_RE.search(text_block)
+        if cutoff:
+            text_block = text_block[:cutoff.start()]
+        
+        text_lines = [
+            line for line in map(str.strip, text_block.split('\n'))
+            if line and not SCORE_OR_SENTIMENT_RE.fullmatch(line)
+        ]
         
         text = ' '.join(text_lines).strip()
         
@@ -134,15 +323,15 @@ def parse_transcript_method1(soup, page_text, url):
     return segments
 
 
-def parse_transcript_method2(soup, page_text, url):
+def parse_transcript_method2(tree, page_text, url):
     """Method 2: Parse using h2 tags directly from HTML."""
     segments = []
     
     # Find all h2 elements
-    h2_tags = soup.find_all('h2')
+    h2_tags = tree.iter('h2')
     
     for h2 in h2_tags:
-        speaker = h2.get_text(strip=True)
+        speaker = get_text(h2, strip=True)
         
         # Skip non-speaker headers
         if not speaker or speaker.lower() in ['note', 'topics', 'entities', 'moderation', 
@@ -152,20 +341,20 @@ def parse_transcript_method2(soup, page_text, url):
         
         # Get following siblings until next h2
         text_parts = []
-        current = h2.find_next_sibling()
+        current = _next_element(h2)
         
-        while current and current.name != 'h2':
-            if current.name in ['p', 'div']:
-                text = current.get_text(strip=True)
+        while current is not None and current.tag != 'h2':
+            if current.tag in ['p', 'div']:
+                text = get_text(current, strip=True)
                 if text and len(text) > 5:
                     # Skip metadata
                     if not any(kw in text.lower() for kw in ['sentiment', 'moderation', 'readability', 
                                                               'flesch', 'loughran', 'harvard', 'vader',
                                                               'gunning', 'coleman', 'smog', 'dale-chall']):
                         # Skip timestamps and scores
-                        if not re.match(r'^\d{2}:\d{2}:\d{2}', text) and not re.match(r'^[\d.]+$', text):
+                        if not TIMESTAMP_PREFIX_RE.match(text) and not DECIMAL_LINE_RE.match(text):
                             text_parts.append(text)
-            current = current.find_next_sibling()
+            current = _next_element(current)
         
         if text_parts:
             combined = ' '.join(text_parts[:3])  # Take first few paragraphs
@@ -181,14 +370,12 @@ def parse_transcript_method2(soup, page_text, url):
     return segments
 
 
-def parse_transcript_method3(soup, page_text, url):
+def parse_transcript_method3(tree, page_text, url):
     """Method 3: Look for speaker names followed by colons or in bold."""
     segments = []
     
     # Common speaker patterns
-    speaker_pattern = r'\b(Donald Trump|Dasha Burns|Reporter|Press|Journalist|[A-Z][a-z]+ [A-Z][a-z]+):\s*([^\n]+)'
-    
-    matches = re.findall(speaker_pattern, page_text)
+    matches = SPEAKER_COLON_RE.findall(page_text)
     
     for speaker, text in matches:
         if text and len(text) > 10:
@@ -203,63 +390,75 @@ def parse_transcript_method3(soup, page_text, url):
     return segments
 
 
-def parse_transcript_method4(soup, page_text, url):
+def parse_transcript_method4(tree, page_text, url):
     """Method 4: Split by timestamp patterns."""
     segments = []
     
-    # Split by timestamp pattern
-    parts = re.split(r'(\d{2}:\d{2}:\d{2}-\d{2}:\d{2}:\d{2})', page_text)
-    
     current_speaker = "Unknown"
     
-    for i, part in enumerate(parts):
-        # Check if previous part might be a speaker name
-        if i > 0 and re.match(r'\d{2}:\d{2}:\d{2}', part):
-            # Look back for speaker
-            prev = parts[i-1].strip().split('\n')
-            for line in reversed(prev[-5:]):
-                line = line.strip()
-                if line and len(line) < 50 and not re.search(r'\d{2}:\d{2}', line):
-                    if not any(kw in line.lower() for kw in ['sentiment', 'score', 'moderation']):
-                        current_speaker = line
-                        break
+    # Walk the timestamp ranges by offset instead of re.split()ting the page;
+    # each range sits between the text chunk before it and the one after it
+    matches = list(TIMESTAMP_RANGE_RE.finditer(page_text))
+    prev_end = 0
+    
+    for k, match in enumerate(matches):
+        before = page_text[prev_end:match.start()]
+        stamp = match.group(1)
+        next_start = matches[k + 1].start() if k + 1 < len(matches) else len(page_text)
+        prev_end = match.end()
+        
+        # The chunk before a range yields the range itself as a segment
+        # (this mirrors what the re.split() walk always produced)
+        segments.append({
+            'speaker': current_speaker,
+            'start_time': before.split('-', 1)[0] if '-' in before else '',
+            'end_time': '',
+            'duration_seconds': 0,
+            'text': stamp
+        })
         
-        # Check if this part contains text after timestamp
-        if i + 1 < len(parts):
-            text = parts[i + 1].strip()
-            lines = text.split('\n')
-            clean_lines = []
-            for line in lines[:10]:
-                line = line.strip()
-                if line.startswith(('Sentiment', 'Moderation', 'Readability')):
+        # Look back over the last few lines before the range for a speaker
+        for line in reversed(before.strip().rsplit('\n', 5)[-5:]):
+            line = line.strip()
+            if line and len(line) < 50 and not CLOCK_RE.search(line):
+                if not any(kw in line.lower() for kw in ['sentiment', 'score', 'moderation']):
+                    current_speaker = line
                     break
-                if line and len(line) > 5:
-                    clean_lines.append(line)
-            
-            if clean_lines:
-                segments.append({
-                    'speaker': current_speaker,
-                    'start_time': part.split('-')[0] if '-' in part else '',
-                    'end_time': '',
-                    'duration_seconds': 0,
-                    'text': ' '.join(clean_lines[:3])
-                })
+        
+        # Text after the range, up to the first metadata line
+        clean_lines = []
+        for line in page_text[prev_end:next_start].strip().split('\n', 10)[:10]:
+            line = line.strip()
+            if line.startswith(('Sentiment', 'Moderation', 'Readability')):
+                break
+            if line and len(line) > 5:
+                clean_lines.append(line)
+        
+        if clean_lines:
+            segments.append({
+                'speaker': current_speaker,
+                'start_time': stamp.split('-', 1)[0],
+                'end_time': '',
+                'duration_seconds': 0,
+                'text': ' '.join(clean_lines[:3])
+            })
     
     return segments
 
 
 def parse_transcript(html, url, debug=False):
     """Parse Factbase transcript HTML into structured data using multiple methods."""
-    soup = BeautifulSoup(html, 'lxml')
+    # lxml builds the tree in C; get_text() reproduces BeautifulSoup's text
+    tree = lxml.html.document_fromstring(html)
     
     # Get title
-    title_elem = soup.find('h1')
-    if not title_elem:
+    title_elem = next(tree.iter('h1'), None)
+    if title_elem is None:
         if debug:
             print("  DEBUG: No h1 found")
         return None
     
-    full_title = title_elem.get_text(strip=True)
+    full_title = get_text(title_elem, strip=True)
     
     # Parse event type
     event_type = "Unknown"
@@ -271,7 +470,7 @@ def parse_transcript(html, url, debug=False):
     
     # Extract date
     event_date = ""
-    date_match = re.search(r'-\s*(\w+\s+\d{1,2},?\s*\d{4})\s*$', full_title)
+    date_match = TITLE_DATE_RE.search(full_title)
     if date_match:
         date_str = date_match.group(1)
         for fmt in ['%B %d, %Y', '%B %d %Y']:
@@ -284,37 +483,37 @@ def parse_transcript(html, url, debug=False):
     
     # Extract location
     location = ""
-    loc_match = re.search(r'\s+(?:in|at)\s+([^-]+?)(?:\s+-|\s*$)', full_title, re.IGNORECASE)
+    loc_match = TITLE_LOCATION_RE.search(full_title)
     if loc_match:
         location = loc_match.group(1).strip()
     
     # Get page text
-    page_text = soup.get_text()
+    page_text = get_page_text(tree)
     
     # Try multiple parsing methods
     segments = None
     method_used = None
     
     # Method 1: ## pattern (most reliable for Factbase)
-    segments = parse_transcript_method1(soup, page_text, url)
+    segments = parse_transcript_method1(tree, page_text, url)
     if segments:
         method_used = "method1_hash"
     
     # Method 2: h2 tags
     if not segments:
-        segments = parse_transcript_method2(soup, page_text, url)
+        segments = parse_transcript_method2(tree, page_text, url)
         if segments:
             method_used = "method2_h2"
     
     # Method 3: Speaker: pattern
     if not segments:
-        segments = parse_transcript_method3(soup, page_text, url)
+        segments = parse_transcript_method3(tree, page_text, url)
         if segments:
             method_used = "method3_colon"
     
     # Method 4: Timestamp splitting
     if not segments:
-        segments = parse_transcript_method4(soup, page_text, url)
+        segments = parse_transcript_method4(tree, page_text, url)
         if segments:
             method_used = "method4_timestamp"
     
@@ -324,16 +523,15 @@ def parse_transcript(html, url, debug=False):
     if not segments:
         return None
     
-    # Determine primary speaker
-    speaker_words = {}
+    # Determine primary speaker (most words; ties go to whoever spoke first)
+    speaker_words = Counter()
     for seg in segments:
-        words = len(seg['text'].split())
-        speaker_words[seg['speaker']] = speaker_words.get(seg['speaker'], 0) + words
+        speaker_words[seg['speaker']] += len(seg['text'].split())
     
-    primary_speaker = max(speaker_words.keys(), key=lambda s: speaker_words[s]) if speaker_words else 'Unknown'
+    primary_speaker = speaker_words.most_common(1)[0][0] if speaker_words else 'Unknown'
     
     # Generate ID
-    id_match = re.search(r'/transcript/([^/]+)/?$', url)
+    id_match = TRANSCRIPT_ID_RE.search(url)
     transcript_id = id_match.group(1) if id_match else hashlib.md5(url.encode()).hexdigest()[:16]
     
     return {
@@ -349,8 +547,13 @@ def parse_transcript(html, url, debug=False):
     }
 
 
-def import_single(url, debug=False):
-    """Import a single transcript."""
+def fetch_and_parse(url, debug=False):
+    """
+    Fetch and parse a single transcript (safe to call from worker threads).
+    Returns (raw_html, data, error); error is None on success. raw_html is
+    already compressed for storage, so zstd runs here in parallel rather than
+    on the database thread, and queued results hold the small blob.
+    """
     try:
         html = fetch_transcript(url)
         
@@ -361,31 +564,81 @@ def import_single(url, debug=False):
             with open(DEBUG_DIR / f"{slug}.html", "w") as f:
                 f.write(html)
         
-        data = parse_transcript(html, url, debug=debug)
-        
-        if not data or not data['segments']:
-            return False, "No segments found"
-        
-        insert_transcript(
-            transcript_id=data['id'],
-            url=data['url'],
-            title=data['title'],
-            primary_speaker=data['primary_speaker'],
-            event_type=data['event_type'],
-            event_date=data['event_date'],
-            location=data['location'],
-            segments=data['segments'],
-            topics=[],
-            entities=[],
-            raw_html=html
-        )
-        
-        return True, f"{len(data['segments'])} segs ({data.get('method', '?')})"
+        return compress_html(html), parse_transcript(html, url, debug=debug), None
         
     except requests.exceptions.HTTPError as e:
-        return False, f"HTTP {e.response.status_code}"
+        return None, None, f"HTTP {e.response.status_code}"
+    except Exception as e:
+        return None, None, str(e)[:50]
+
+
+def transcript_row(raw_html, data, error):
+    """
+    Turn a fetch_and_parse result into insert_transcript keyword arguments.
+    Returns (row, message); row is None when there is nothing to insert.
+    """
+    if error:
+        return None, error
+    
+    if not data or not data['segments']:
+        return None, "No segments found"
+    
+    row = dict(
+        transcript_id=data['id'],
+        url=data['url'],
+        title=data['title'],
+        primary_speaker=data['primary_speaker'],
+        event_type=data['event_type'],
+        event_date=data['event_date'],
+        location=data['location'],
+        segments=data['segments'],
+        topics=[],
+        entities=[],
+        raw_html=raw_html
+    )
+    return row, f"{len(data['segments'])} segs ({data.get('method', '?')})"
+
+
+def save_batch(batch, completed, failed, log):
+    """
+    Insert (url, row) pairs in one transaction and record them in completed
+    (and the progress log). If the batch fails it is retried row by row, so a
+    bad row only fails itself. Returns the number of transcripts saved.
+    """
+    try:
+        insert_transcripts([row for _, row in batch])
+        for url, _ in batch:
+            completed.add(url)
+            log_progress(log, url, "completed")
+        return len(batch)
+    except Exception:
+        pass
+    
+    saved = 0
+    for url, row in batch:
+        try:
+            insert_transcript(**row)
+            completed.add(url)
+            log_progress(log, url, "completed")
+            saved += 1
+        except Exception as e:
+            failed.add(url)
+            log_progress(log, url, "failed")
+            print(f"  ✗ {url.split('/transcript/')[-1][:40]}: {str(e)[:50]}")
+    return saved
+
+
+def import_single(url, debug=False):
+    """Import a single transcript."""
+    row, msg = transcript_row(*fetch_and_parse(url, debug=debug))
+    if row is None:
+        return False, msg
+    
+    try:
+        insert_transcript(**row)
     except Exception as e:
         return False, str(e)[:50]
+    return True, msg
 
 
 def debug_single(url):
@@ -403,8 +656,8 @@ def debug_single(url):
             f.write(html)
         print(f"Saved to {DEBUG_DIR}/debug_page.html")
         
-        soup = BeautifulSoup(html, 'lxml')
-        page_text = soup.get_text()
+        tree = lxml.html.document_fromstring(html)
+        page_text = get_page_text(tree)
         
         with open(DEBUG_DIR / "debug_text.txt", "w") as f:
             f.write(page_text)
@@ -413,25 +666,25 @@ def debug_single(url):
         print()
         print("=" * 50)
         print("H1 TITLE:")
-        h1 = soup.find('h1')
-        print(h1.get_text() if h1 else "NOT FOUND")
+        h1 = next(tree.iter('h1'), None)
+        print(get_text(h1) if h1 is not None else "NOT FOUND")
         
         print()
         print("=" * 50)
         print("H2 TAGS (first 10):")
-        for h2 in soup.find_all('h2')[:10]:
-            print(f"  - {h2.get_text()[:60]}")
+        for h2 in list(tree.iter('h2'))[:10]:
+            print(f"  - {get_text(h2)[:60]}")
         
         print()
         print("=" * 50)
         print("TIMESTAMP PATTERNS (first 10):")
-        times = re.findall(r'\d{2}:\d{2}:\d{2}', page_text)[:10]
+        times = TIMESTAMP_RE.findall(page_text)[:10]
         print(times)
         
         print()
         print("=" * 50)
         print("## PATTERNS (first 10):")
-        hashes = re.findall(r'##\s+[^\n]+', page_text)[:10]
+        hashes = HASH_HEADER_RE.findall(page_text)[:10]
         for h in hashes:
             print(f"  {h[:60]}")
         
@@ -439,16 +692,16 @@ def debug_single(url):
         print("=" * 50)
         print("TRYING PARSE METHODS:")
         
-        segments1 = parse_transcript_method1(soup, page_text, url)
+        segments1 = parse_transcript_method1(tree, page_text, url)
         print(f"  Method 1 (## pattern): {len(segments1)} segments")
         
-        segments2 = parse_transcript_method2(soup, page_text, url)
+        segments2 = parse_transcript_method2(tree, page_text, url)
         print(f"  Method 2 (h2 tags): {len(segments2)} segments")
         
-        segments3 = parse_transcript_method3(soup, page_text, url)
+        segments3 = parse_transcript_method3(tree, page_text, url)
         print(f"  Method 3 (speaker:): {len(segments3)} segments")
         
-        segments4 = parse_transcript_method4(soup, page_text, url)
+        segments4 = parse_transcript_method4(tree, page_text, url)
         print(f"  Method 4 (timestamps): {len(segments4)} segments")
         
         # Show sample segments
@@ -489,9 +742,10 @@ def main():
             print("  python3 import_all.py --reset          # Reset progress and start over")
             return
         elif sys.argv[1] == "--reset":
-            if PROGRESS_FILE.exists():
-                PROGRESS_FILE.unlink()
-                print("Progress reset.")
+            for path in (PROGRESS_FILE, PROGRESS_LOG_FILE):
+                if path.exists():
+                    path.unlink()
+            print("Progress reset.")
             return
     
     # Check database
@@ -514,7 +768,9 @@ def main():
     failed = set(progress.get("failed", []))
     no_segments = set(progress.get("no_segments", []))
     
-    pending = [u for u in urls if u not in completed and u not in no_segments]
+    # One exact hash lookup per URL (a false positive would skip a transcript for good)
+    done = completed | no_segments
+    pending = [u for u in urls if u not in done]
     
     print(f"Already completed: {len(completed)}")
     print(f"No segments (skipped): {len(no_segments)}")
@@ -527,7 +783,7 @@ def main():
         print(f"Database has {stats['total_transcripts']} transcripts")
         return
     
-    print("Starting import (1.5s delay between requests)...")
+    print(f"Starting import ({MAX_WORKERS} workers, up to {1 / MIN_REQUEST_INTERVAL:g} requests/s)...")
     print("Press Ctrl+C to stop and resume later")
     print()
     print("TIP: If many fail, run: python3 import_all.py --debug-first")
@@ -536,44 +792,62 @@ def main():
     success = 0
     errors = 0
     no_seg_count = 0
+    # Parsed (url, row) pairs waiting for the next database transaction
+    batch = []
     
+    # Debug first few if having issues
+    debug_flags = [i <= 3 and len(completed) == 0 for i in range(1, len(pending) + 1)]
+    
+    # State changes are appended as they happen; the snapshot is only
+    # rewritten once at the end
+    log = open_progress_log()
+    
+    # Fetch and parse in worker threads; results come back in order and all
+    # database writes stay on this thread
+    pool = ThreadPoolExecutor(max_workers=MAX_WORKERS)
     try:
-        for i, url in enumerate(pending, 1):
+        results = pool.map(fetch_and_parse, pending, debug_flags)
+        
+        for i, (url, result) in enumerate(zip(pending, results), 1):
             slug = url.split("/transcript/")[-1][:40]
             print(f"[{i}/{len(pending)}] {slug}...", end=" ", flush=True)
             
-            # Debug first few if having issues
-            debug = (i <= 3 and len(completed) == 0)
-            
-            ok, msg = import_single(url, debug=debug)
+            row, msg = transcript_row(*result)
             
-            if ok:
-                completed.add(url)
-                success += 1
+            if row is not None:
+                batch.append((url, row))
                 print(f"✓ {msg}")
             elif "No segments" in msg:
                 no_segments.add(url)
+                log_progress(log, url, "no_segments")
                 no_seg_count += 1
                 print(f"⊘ {msg}")
             else:
                 failed.add(url)
+                log_progress(log, url, "failed")
                 errors += 1
                 print(f"✗ {msg}")
             
-            # Save progress every 10
-            if i % 10 == 0:
-                save_progress({
-                    "completed": list(completed), 
-                    "failed": list(failed),
-                    "no_segments": list(no_segments)
-                })
-            
-            time.sleep(1.5)
+            if len(batch) >= INSERT_BATCH_SIZE:
+                saved = save_batch(batch, completed, failed, log)
+                success += saved
+                errors += len(batch) - saved
+                batch = []
     
     except KeyboardInterrupt:
         print("\n\nStopped by user. Progress saved.")
-    
-    # Final save
+    finally:
+        # Don't wait for (or start) fetches that were still queued
+        pool.shutdown(wait=False, cancel_futures=True)
+    
+    # Write whatever is still batched (also after Ctrl+C)
+    if batch:
+        saved = save_batch(batch, completed, failed, log)
+        success += saved
+        errors += len(batch) - saved
+    log.close()
+    
+    # Final save (replaces the log with a fresh snapshot)
     save_progress({
         "completed": list(completed), 
         "failed": list(failed),
@@ -30,6 +30,9 @@ try:
 except ImportError:
     HAS_REQUESTS = False
 
+# Tags parse_factbase_html reads; everything outside them is left unparsed
+FACTBASE_TAGS = ['h1', 'h2', 'p']
+
 
 def fetch_transcript_html(url: str) -> str:
     """Fetch HTML from a transcript URL."""
@@ -50,9 +53,11 @@ def parse_factbase_html(html: str, url: str) -> dict:
     Parse Factbase HTML into transcript data.
     This is a more robust parser specifically for Factbase pages.
     """
-    from bs4 import BeautifulSoup
+    from bs4 import BeautifulSoup, SoupStrainer
     
-    soup = BeautifulSoup(html, 'html.parser')
+    # Only the title, speaker headers and paragraphs are read; skip building
+    # nodes for everything else (scripts, nav, analysis widgets)
+    soup = BeautifulSoup(html, 'lxml', parse_only=SoupStrainer(FACTBASE_TAGS))
     
     # Extract title
     title_elem = soup.find('h1')
@@ -4,7 +4,7 @@ import time
 import json
 from datetime import datetime
 from database import Database
-from text_analysis import analyze_word_frequency, count_words
+from text_analysis import analyze_text
 
 class FactBaseScraper:
     def __init__(self):
@@ -302,8 +302,8 @@ class FactBaseScraper:
             # Merge metadata
             full_data = {**transcript, **content}
 
-            # Calculate word count
-            word_count = count_words(full_data['full_text'])
+            # Word count and frequencies from one tokenization pass
+            word_count, word_freqs = analyze_text(full_data['full_text'])
             print(f"  Word count: {word_count}")
 
             # Save to database
@@ -318,11 +318,11 @@ class FactBaseScraper:
             )
 
             if transcript_id:
-                # Analyze word frequency
-                word_freqs = analyze_word_frequency(full_data['full_text'])
                 self.db.insert_word_frequencies(transcript_id, word_freqs)
                 print(f"  Saved to database (ID: {transcript_id})")
                 success_count += 1
+            # Transcript + word frequencies land in one commit
+            self.db.commit()
 
         print(f"\n{'='*80}")
         print(f"SCRAPING COMPLETE")
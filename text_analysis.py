@@ -1,6 +1,11 @@
 import re
 from collections import Counter
-from typing import Dict
+from typing import Dict, Tuple
+
+# Tokens counted by count_words / analyze_text
+WORD_RE = re.compile(r'\w+')
+# Lowercase words counted by analyze_word_frequency
+ALPHA_WORD_RE = re.compile(r'\b[a-z]+\b')
 
 COMMON_WORDS = {
     'the', 'be', 'to', 'of', 'and', 'a', 'in', 'that', 'have', 'i',
@@ -48,6 +53,38 @@ def analyze_word_frequency(text: str, min_length: int = 3,
     # Return top N words
     return dict(word_counts.most_common(max_words))
 
+def analyze_text(text: str, min_length: int = 3,
+                 exclude_common: bool = True,
+                 max_words: int = 500) -> Tuple[int, Dict[str, int]]:
+    """
+    Word count and word frequencies from a single tokenization pass
+
+    Returns the same (count_words(text), analyze_word_frequency(text, ...))
+    pair as calling both functions separately
+    """
+    # Count distinct tokens first, then fold case on the (far fewer) keys
+    token_counts = Counter(WORD_RE.findall(text))
+    word_count = sum(token_counts.values())
+
+    word_counts = Counter()
+    for token, n in token_counts.items():
+        word = token.lower()
+        if word.isascii() and word.isalpha():
+            words = (word,)
+        elif word.isascii():
+            # Digits/underscores glue letters into one \w token: no [a-z] word
+            continue
+        else:
+            # Rare non-ASCII token - lowercasing can split it into several words
+            words = ALPHA_WORD_RE.findall(word)
+
+        for word in words:
+            if len(word) >= min_length:
+                if not exclude_common or word not in COMMON_WORDS:
+                    word_counts[word] += n
+
+    return word_count, dict(word_counts.most_common(max_words))
+
 def count_words(text: str) -> int:
     """Count total words in text"""
     words = re.findall(r'\b\w+\b', text)